@@ -1,11 +1,89 @@
+import os
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy import interpolate
 import warnings
 
 warnings.filterwarnings('ignore')
 plt.rcParams['font.sans-serif'] = ['SimHei']
 
+try:
+    # Numba为可选加速依赖：缺失时自动退回纯NumPy路径
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    @njit(fastmath=True)
+    def _emissivity_silicon_point(w, nv, kv, av, thickness):
+        """单个(λ, t)点的硅衬底发射率（与_silicon_substrate_model逐点等价）
+
+        标量分支数学，融合遍历避免NumPy多趟where带来的内存往返。
+        """
+        quarter_wave = (nv * thickness / w) % 1.0
+        destructive = 0.2 <= quarter_wave <= 0.3
+        constructive = 0.7 <= quarter_wave <= 0.8
+
+        if 0.3 <= w <= 2.5:  # 太阳波段
+            if thickness < 2.0:
+                val = 0.15 if destructive else 0.08
+            else:
+                val = 0.05 + 0.05 * (1 - np.exp(-thickness / 50))
+        elif 8 <= w <= 13:  # 大气窗口
+            if kv > 0.1:
+                if thickness < 5.0:
+                    if destructive:
+                        val = 0.95
+                    elif constructive:
+                        val = 0.3
+                    else:
+                        val = 0.6 + 0.3 * (1 - np.exp(-thickness / 3))
+                else:
+                    absorption_depth = 1.0 / av if av > 0 else 1000.0
+                    if thickness > 2 * absorption_depth:
+                        val = 0.92
+                    else:
+                        val = 0.7 + 0.25 * (1 - np.exp(-thickness / absorption_depth))
+            else:
+                val = 0.3
+        else:  # 其他波段
+            val = 0.4 + 0.3 * (1 - np.exp(-thickness / 20))
+
+        return val
+
+
+    @njit(fastmath=True, parallel=True)
+    def _emissivity_silicon_kernel(wl, n, k, alpha, thickness, out):
+        """硅衬底逐波长发射率核（固定厚度，波长并行）"""
+        for i in prange(wl.size):
+            out[i] = _emissivity_silicon_point(wl[i], n[i], k[i], alpha[i], thickness)
+
+
+    @njit(fastmath=True, parallel=True)
+    def _emissivity_silicon_matrix(wl, n, k, alpha, thicknesses, out):
+        """(厚度×波长)发射率矩阵核，厚度行并行"""
+        for j in prange(thicknesses.size):
+            t = thicknesses[j]
+            for i in range(wl.size):
+                out[j, i] = _emissivity_silicon_point(wl[i], n[i], k[i], alpha[i], t)
+
+
+    @njit(fastmath=True, parallel=True)
+    def _band_average_sweep(wl, n, k, alpha, thicknesses, out):
+        """逐厚度并行的波段平均发射率归约（不落地中间矩阵）"""
+        for j in prange(thicknesses.size):
+            t = thicknesses[j]
+            acc = 0.0
+            for i in range(wl.size):
+                val = _emissivity_silicon_point(wl[i], n[i], k[i], alpha[i], t)
+                # 与_emissivity_from_precomputed一致的物理范围截断
+                if val < 0.0:
+                    val = 0.0
+                elif val > 0.98:
+                    val = 0.98
+                acc += val
+            out[j] = acc / wl.size
+
 
 class PDMSFilmModel:
     """
@@ -15,218 +93,93 @@ class PDMSFilmModel:
 
     def __init__(self, substrate_type='silicon'):
         self.substrate_type = substrate_type
+        self._band_cache = {}  # (λmin, λmax, n_points) -> 预插值的波段网格
+        self._band_avg_cache = {}  # (λmin, λmax, 厚度, n_points) -> 波段平均发射率
+        # 衬底类型构造后不再变化，绑定一次专用模型，
+        # 热路径上省去逐次的if/elif分派
+        self._substrate_model = {
+            'air': self._air_substrate_model,
+            'metal': self._metal_substrate_model,
+        }.get(substrate_type, self._silicon_substrate_model)
+
         self.load_pdms_data()
         self.validate_physical_parameters()
 
+        # 大气窗口/太阳波段反复使用，构造时即预插值好网格
+        self._get_band_cache(8, 13, 30)
+        self._get_band_cache(0.3, 2.5, 30)
+
     def load_pdms_data(self):
         """加载PDMS光学常数数据"""
-        wavelengths_real = np.array([
-            0.40, 0.41, 0.42, 0.43, 0.44, 0.45, 0.46, 0.47, 0.48, 0.49,
-            0.50, 0.51, 0.52, 0.53, 0.54, 0.55, 0.56, 0.57, 0.58, 0.59,
-            0.60, 0.61, 0.62, 0.63, 0.64, 0.65, 0.66, 0.67, 0.68, 0.69,
-            0.70, 0.71, 0.72, 0.73, 0.74, 0.75, 0.76, 0.77, 0.78, 0.79,
-            0.80, 0.81, 0.82, 0.83, 0.84, 0.85, 0.86, 0.87, 0.88, 0.89,
-            0.90, 0.91, 0.92, 0.93, 0.94, 0.95, 0.96, 0.97, 0.98, 0.99,
-            1.00, 1.01, 1.02, 1.03, 1.04, 1.05, 1.06, 1.07, 1.08, 1.09,
-            1.10, 1.11, 1.12, 1.13, 1.14, 1.15, 1.16, 1.17, 1.18, 1.19,
-            1.20, 1.21, 1.22, 1.23, 1.24, 1.25, 1.26, 1.27, 1.28, 1.29,
-            1.30, 1.31, 1.32, 1.33, 1.34, 1.35, 1.36, 1.37, 1.38, 1.39,
-            1.40, 1.41, 1.42, 1.43, 1.44, 1.45, 1.46, 1.47, 1.48, 1.49,
-            1.50, 1.51, 1.52, 1.53, 1.54, 1.55, 1.56, 1.57, 1.58, 1.59,
-            1.60, 1.61, 1.62, 1.63, 1.64, 1.65, 1.66, 1.67, 1.68, 1.69,
-            1.70, 1.71, 1.72, 1.73, 1.74, 1.75, 1.76, 1.77, 1.78, 1.79,
-            1.80, 1.81, 1.82, 1.83, 1.84, 1.85, 1.86, 1.87, 1.88, 1.89,
-            1.90, 1.91, 1.92, 1.93, 1.94, 1.95, 1.96, 1.97, 1.98, 1.99,
-            2.00, 2.0097, 2.0190, 2.0285, 2.0381, 2.0478, 2.0575, 2.0673, 2.0773, 2.0873,
-            2.0975, 2.1077, 2.1180, 2.1285, 2.1390, 2.1496, 2.1568, 2.1676, 2.1785, 2.1896,
-            2.1970, 2.2082, 2.2196, 2.2272, 2.2387, 2.2465, 2.2582, 2.2661, 2.2781, 2.2861,
-            2.2983, 2.3065, 2.3188, 2.3272, 2.3398, 2.3482, 2.3568, 2.3697, 2.3784, 2.3872,
-            2.3960, 2.4093, 2.4183, 2.4274, 2.4365, 2.4457, 2.4596, 2.4690, 2.4784, 2.4880,
-            2.4975, 2.5072, 2.5169, 2.5268, 2.5366, 2.5466, 2.5567, 2.5668, 2.5770, 2.5873,
-            2.5976, 2.6081, 2.6186, 2.6293, 2.6400, 2.6454, 2.6562, 2.6671, 2.6782, 2.6893,
-            2.6949, 2.7061, 2.7175, 2.7289, 2.7347, 2.7462, 2.7579, 2.7697, 2.7756, 2.7876,
-            2.7996, 2.8057, 2.8179, 2.8240, 2.8364, 2.8489, 2.8551, 2.8678, 2.8741, 2.8869,
-            2.8998, 2.9063, 2.9194, 2.9260, 2.9393, 2.9460, 2.9594, 2.9662, 2.9798, 2.9867,
-            2.9936, 3.0075, 3.0145, 3.0286, 3.0357, 3.0499, 3.0571, 3.0644, 3.0789, 3.0863,
-            3.0936, 3.1085, 3.1159, 3.1234, 3.1386, 3.1462, 3.1538, 3.1693, 3.1770, 3.1848,
-            3.1927, 3.2085, 3.2164, 3.2244, 3.2325, 3.2487, 3.2569, 3.2651, 3.2733, 3.2899,
-            3.2983, 3.3067, 3.3152, 3.3237, 3.3322, 3.3494, 3.3581, 3.3668, 3.3756, 3.3844,
-            3.3933, 3.4022, 3.4111, 3.4292, 3.4383, 3.4474, 3.4566, 3.4658, 3.4751, 3.4845,
-            3.4939, 3.5033, 3.5128, 3.5224, 3.5320, 3.5416, 3.5513, 3.5611, 3.5709, 3.5807,
-            3.5907, 3.6006, 3.6107, 3.6207, 3.6309, 3.6411, 3.6513, 3.6617, 3.6720, 3.6825,
-            3.6930, 3.7035, 3.7141, 3.7248, 3.7355, 3.7463, 3.7572, 3.7681, 3.7791, 3.7901,
-            3.8013, 3.8124, 3.8237, 3.8350, 3.8464, 3.8578, 3.8693, 3.8809, 3.8926, 3.9043,
-            3.9161, 3.9280, 3.9399, 3.9519, 3.9640, 3.9762, 3.9884, 4.0007, 4.0131, 4.0255,
-            4.0381, 4.0507, 4.0634, 4.0762, 4.0890, 4.1020, 4.1150, 4.1281, 4.1413, 4.1546,
-            4.1679, 4.1814, 4.1949, 4.2085, 4.2222, 4.2360, 4.2499, 4.2639, 4.2780, 4.2921,
-            4.3064, 4.3208, 4.3352, 4.3498, 4.3644, 4.3791, 4.3940, 4.4089, 4.4240, 4.4391,
-            4.4544, 4.4697, 4.4852, 4.5008, 4.5165, 4.5323, 4.5482, 4.5642, 4.5803, 4.5965,
-            4.6129, 4.6294, 4.6460, 4.6627, 4.6795, 4.6965, 4.7136, 4.7308, 4.7481, 4.7655,
-            4.7831, 4.8008, 4.8187, 4.8367, 4.8548, 4.8730, 4.8914, 4.9100, 4.9286, 4.9474,
-            4.9664, 4.9855, 5.0047, 5.0241, 5.0437, 5.0634, 5.0832, 5.1033, 5.1234, 5.1438,
-            5.1643, 5.1849, 5.2057, 5.2267, 5.2479, 5.2692, 5.2907, 5.3124, 5.3343, 5.3563,
-            5.3785, 5.4009, 5.4235, 5.4463, 5.4693, 5.4925, 5.5159, 5.5394, 5.5632, 5.5872,
-            5.6114, 5.6358, 5.6604, 5.6852, 5.7103, 5.7355, 5.7610, 5.7867, 5.8127, 5.8389,
-            5.8653, 5.8919, 5.9188, 5.9460, 5.9734, 6.0011, 6.0290, 6.0571, 6.0856, 6.1143,
-            6.1433, 6.1725, 6.2020, 6.2319, 6.2620, 6.2924, 6.3231, 6.3541, 6.3854, 6.4170,
-            6.4489, 6.4811, 6.5137, 6.5466, 6.5798, 6.6134, 6.6473, 6.6816, 6.7162, 6.7512,
-            6.7865, 6.8223, 6.8583, 6.8948, 6.9317, 6.9690, 7.0066, 7.0447, 7.0832, 7.1221,
-            7.1615, 7.2013, 7.2415, 7.2822, 7.3233, 7.3649, 7.4070, 7.4496, 7.4926, 7.5362,
-            7.5803, 7.6249, 7.6700, 7.7156, 7.7618, 7.8086, 7.8559, 7.9038, 7.9523, 8.0014,
-            8.0511, 8.1014, 8.1524, 8.2040, 8.2562, 8.3091, 8.3628, 8.4171, 8.4721, 8.5278,
-            8.5843, 8.6415, 8.6995, 8.7583, 8.8179, 8.8783, 8.9395, 9.0016, 9.0645, 9.1284,
-            9.1931, 9.2588, 9.3254, 9.3930, 9.4615, 9.5311, 9.6017, 9.6733, 9.7461, 9.8199,
-            9.8949, 9.9710, 10.048, 10.127, 10.207, 10.288, 10.370, 10.453, 10.538, 10.625,
-            10.713, 10.802, 10.893, 10.985, 11.079, 11.174, 11.272, 11.370, 11.471, 11.573,
-            11.678, 11.784, 11.892, 12.002, 12.114, 12.229, 12.345, 12.464, 12.585, 12.708,
-            12.834, 12.962, 13.093, 13.227, 13.363, 13.502, 13.645, 13.790, 13.938, 14.089,
-            14.244, 14.403, 14.564, 14.730, 14.899, 15.072, 15.250, 15.431, 15.617, 15.808,
-            16.003, 16.203, 16.408, 16.618, 16.834, 17.056, 17.283, 17.517, 17.757, 18.003,
-            18.257, 18.518, 18.786, 19.062, 19.347, 19.640, 19.942
-        ])
-
-        n_real = np.array([
-            1.41491, 1.41403, 1.41300, 1.41179, 1.41113, 1.41033, 1.40943, 1.40866, 1.40802, 1.40733,
-            1.40675, 1.40614, 1.40557, 1.40513, 1.40430, 1.40420, 1.40375, 1.40338, 1.40292, 1.40259,
-            1.40202, 1.40158, 1.40139, 1.40121, 1.40059, 1.40047, 1.40022, 1.40006, 1.39984, 1.39958,
-            1.39907, 1.39905, 1.39871, 1.39817, 1.39814, 1.39765, 1.39750, 1.39727, 1.39660, 1.39645,
-            1.39601, 1.39617, 1.39684, 1.39701, 1.39629, 1.39687, 1.39671, 1.39652, 1.39624, 1.39629,
-            1.39616, 1.39610, 1.39583, 1.39584, 1.39554, 1.39546, 1.39552, 1.39537, 1.39513, 1.39506,
-            1.39525, 1.39523, 1.39544, 1.39121, 1.39127, 1.39181, 1.39102, 1.39193, 1.39217, 1.39220,
-            1.39140, 1.39202, 1.39164, 1.39084, 1.39105, 1.39087, 1.39135, 1.39134, 1.39199, 1.39145,
-            1.39106, 1.38948, 1.39053, 1.38988, 1.38929, 1.38975, 1.38999, 1.39049, 1.39009, 1.38910,
-            1.38878, 1.38850, 1.38844, 1.38895, 1.38870, 1.38897, 1.38914, 1.39000, 1.38972, 1.38923,
-            1.38938, 1.38836, 1.38932, 1.38933, 1.38929, 1.38840, 1.38840, 1.38895, 1.38968, 1.38914,
-            1.38886, 1.38844, 1.38850, 1.38804, 1.38863, 1.38922, 1.38841, 1.38815, 1.38787, 1.38755,
-            1.38748, 1.38731, 1.38811, 1.38725, 1.38609, 1.38759, 1.38751, 1.38797, 1.38773, 1.38719,
-            1.38694, 1.38755, 1.38689, 1.38756, 1.38736, 1.38736, 1.38611, 1.38703, 1.38651, 1.38645,
-            1.38644, 1.38680, 1.38704, 1.38639, 1.38730, 1.38712, 1.38634, 1.38571, 1.38651, 1.38631,
-            1.38600, 1.38610, 1.38585, 1.38623, 1.38625, 1.38571, 1.38546, 1.38623, 1.38586, 1.38653,
-            1.38648, 1.39924, 1.39793, 1.39715, 1.39551, 1.39481, 1.39529, 1.39562, 1.39677, 1.39707,
-            1.39523, 1.39490, 1.39475, 1.39453, 1.39614, 1.39796, 1.39915, 1.39923, 1.39721, 1.39679,
-            1.39814, 1.40006, 1.40093, 1.40083, 1.39913, 1.39783, 1.39753, 1.39782, 1.39884, 1.39983,
-            1.39921, 1.39840, 1.39812, 1.39817, 1.39834, 1.39873, 1.39875, 1.39769, 1.39710, 1.39638,
-            1.39638, 1.39737, 1.39788, 1.39844, 1.39870, 1.39872, 1.39708, 1.39680, 1.39698, 1.39703,
-            1.39646, 1.39605, 1.39625, 1.39632, 1.39528, 1.39446, 1.39468, 1.39547, 1.39589, 1.39548,
-            1.39486, 1.39458, 1.39407, 1.39401, 1.39501, 1.39538, 1.39534, 1.39507, 1.39542, 1.39518,
-            1.39492, 1.39514, 1.39539, 1.39509, 1.39508, 1.39535, 1.39543, 1.39596, 1.39632, 1.39618,
-            1.39533, 1.39520, 1.39570, 1.39604, 1.39633, 1.39575, 1.39494, 1.39319, 1.39313, 1.39458,
-            1.39513, 1.39478, 1.39497, 1.39484, 1.39403, 1.39363, 1.39380, 1.39377, 1.39379, 1.39366,
-            1.39342, 1.39390, 1.39431, 1.39431, 1.39427, 1.39371, 1.39288, 1.39204, 1.39114, 1.39119,
-            1.39144, 1.39225, 1.39210, 1.39168, 1.39114, 1.39112, 1.39088, 1.39129, 1.39169, 1.39173,
-            1.39124, 1.39036, 1.38993, 1.38921, 1.38876, 1.38817, 1.38737, 1.38650, 1.38627, 1.38658,
-            1.38591, 1.38448, 1.38272, 1.38100, 1.37863, 1.37097, 1.36967, 1.37687, 1.39316, 1.40866,
-            1.41427, 1.41184, 1.40699, 1.40079, 1.40068, 1.40129, 1.40155, 1.40126, 1.40054, 1.39949,
-            1.39857, 1.39804, 1.39751, 1.39708, 1.39706, 1.39677, 1.39639, 1.39644, 1.39645, 1.39613,
-            1.39573, 1.39526, 1.39488, 1.39425, 1.39387, 1.39371, 1.39336, 1.39299, 1.39275, 1.39279,
-            1.39285, 1.39292, 1.39338, 1.39353, 1.39284, 1.39221, 1.39204, 1.39178, 1.39137, 1.39117,
-            1.39096, 1.39052, 1.39012, 1.39015, 1.39046, 1.39035, 1.38984, 1.38949, 1.38922, 1.38909,
-            1.38911, 1.38899, 1.38885, 1.38895, 1.38901, 1.38868, 1.38831, 1.38835, 1.38836, 1.38825,
-            1.38827, 1.38831, 1.38821, 1.38796, 1.38747, 1.38699, 1.38686, 1.38674, 1.38644, 1.38645,
-            1.38652, 1.38611, 1.38578, 1.38612, 1.38707, 1.38743, 1.38623, 1.38489, 1.38445, 1.38487,
-            1.38482, 1.38393, 1.38330, 1.38299, 1.38257, 1.38213, 1.38189, 1.38216, 1.38250, 1.38217,
-            1.38162, 1.38145, 1.38125, 1.38079, 1.38026, 1.37972, 1.37925, 1.37880, 1.37837, 1.37807,
-            1.37826, 1.37878, 1.37978, 1.38045, 1.38033, 1.37971, 1.37893, 1.37851, 1.37861, 1.37872,
-            1.37836, 1.37783, 1.37745, 1.37699, 1.37667, 1.37645, 1.37643, 1.37627, 1.37551, 1.37478,
-            1.37452, 1.37413, 1.37342, 1.37301, 1.37286, 1.37230, 1.37140, 1.37101, 1.37112, 1.37151,
-            1.37161, 1.37116, 1.37061, 1.37010, 1.36974, 1.36945, 1.36930, 1.36857, 1.36819, 1.36785,
-            1.36698, 1.36623, 1.36576, 1.36563, 1.36493, 1.36400, 1.36376, 1.36366, 1.36332, 1.36268,
-            1.36188, 1.36124, 1.36063, 1.36017, 1.35952, 1.35851, 1.35788, 1.35756, 1.35700, 1.35636,
-            1.35602, 1.35546, 1.35444, 1.35327, 1.35208, 1.35141, 1.35101, 1.34985, 1.34856, 1.34770,
-            1.34668, 1.34572, 1.34448, 1.34381, 1.34327, 1.34257, 1.34188, 1.34096, 1.33948, 1.33844,
-            1.33698, 1.33518, 1.33420, 1.33287, 1.33102, 1.32961, 1.32711, 1.32364, 1.32168, 1.32053,
-            1.31839, 1.31494, 1.31223, 1.31191, 1.31155, 1.30835, 1.30306, 1.30038, 1.30332, 1.30790,
-            1.30939, 1.30643, 1.30087, 1.29479, 1.28942, 1.28363, 1.27697, 1.27066, 1.26412, 1.25650,
-            1.24758, 1.23651, 1.22417, 1.20747, 1.18420, 1.13872, 1.06920, 1.13086, 1.31619, 1.42903,
-            1.38024, 1.31925, 1.28177, 1.25491, 1.23390, 1.21820, 1.20668, 1.19571, 1.18132, 1.16258,
-            1.14039, 1.11398, 1.07840, 1.03705, 0.99077, 0.94243, 0.90850, 0.91694, 0.99296, 1.12582,
-            1.27070, 1.38675, 1.46460, 1.51165, 1.53749, 1.55207, 1.56879, 1.60177, 1.66994, 1.77468,
-            1.85128, 1.83876, 1.77344, 1.70999, 1.66025, 1.61895, 1.58348, 1.55340, 1.52658, 1.50134,
-            1.47663, 1.45099, 1.42981, 1.41565, 1.39727, 1.36630, 1.32958, 1.30103, 1.30308, 1.32585,
-            1.33199, 1.33215, 1.33290, 1.28572, 1.23134, 1.25325, 1.37130, 1.60462, 1.86355, 1.96263,
-            1.89414, 1.79653, 1.73460, 1.71230, 1.69554, 1.66481, 1.63533, 1.61279, 1.59113, 1.57651,
-            1.57656, 1.58157, 1.58549, 1.58457, 1.57902, 1.57898, 1.57744, 1.56572, 1.55054, 1.53957,
-            1.53249, 1.52491, 1.51758, 1.51612, 1.51225, 1.50642, 1.50336, 1.50038, 1.49764, 1.50001,
-            1.50080, 1.49350, 1.49025, 1.49254, 1.49056, 1.48533, 1.48051
-        ])
-
-        k_real = np.array([
-            1.40E-06, 1.38E-06, 1.38E-06, 1.40E-06, 1.40E-06, 1.41E-06, 1.42E-06, 1.43E-06, 1.43E-06, 1.46E-06,
-            1.46E-06, 1.47E-06, 1.48E-06, 1.48E-06, 1.49E-06, 1.51E-06, 1.50E-06, 1.53E-06, 1.55E-06, 1.54E-06,
-            1.57E-06, 1.57E-06, 1.57E-06, 1.58E-06, 1.58E-06, 1.59E-06, 1.58E-06, 1.59E-06, 1.60E-06, 1.60E-06,
-            1.61E-06, 1.62E-06, 1.63E-06, 1.64E-06, 1.69E-06, 1.66E-06, 1.65E-06, 1.67E-06, 1.67E-06, 1.67E-06,
-            1.69E-06, 1.70E-06, 1.72E-06, 1.73E-06, 1.62E-06, 1.76E-06, 1.70E-06, 2.22E-06, 2.34E-06, 2.39E-06,
-            2.32E-06, 2.31E-06, 2.79E-06, 2.60E-06, 2.58E-06, 2.32E-06, 2.78E-06, 2.63E-06, 2.45E-06, 2.56E-06,
-            2.88E-06, 2.26E-06, 2.61E-06, 2.54E-06, 2.44E-06, 2.38E-06, 2.47E-06, 2.52E-06, 2.57E-06, 2.76E-06,
-            2.70E-06, 2.40E-06, 2.66E-06, 2.85E-06, 3.42E-06, 4.81E-06, 4.84E-06, 5.34E-06, 1.10E-05, 1.46E-05,
-            4.75E-06, 3.87E-06, 3.70E-06, 3.00E-06, 2.89E-06, 3.00E-06, 3.04E-06, 3.16E-06, 3.19E-06, 3.11E-06,
-            3.14E-06, 3.11E-06, 3.12E-06, 3.25E-06, 3.54E-06, 4.13E-06, 5.43E-06, 9.45E-06, 9.79E-06, 1.14E-05,
-            1.42E-05, 1.24E-05, 7.87E-06, 6.99E-06, 6.05E-06, 5.11E-06, 5.12E-06, 5.10E-06, 3.03E-06, 5.34E-06,
-            5.84E-06, 6.90E-06, 7.80E-06, 7.85E-06, 7.98E-06, 7.83E-06, 7.28E-06, 5.95E-06, 5.23E-06, 5.01E-06,
-            5.04E-06, 5.17E-06, 5.53E-06, 6.14E-06, 7.67E-06, 9.77E-06, 1.02E-05, 1.08E-05, 1.81E-05, 7.25E-05,
-            5.97E-05, 3.22E-05, 2.16E-05, 3.96E-05, 7.03E-05, 7.41E-05, 3.46E-05, 2.28E-05, 2.78E-05, 2.36E-05,
-            1.26E-05, 9.26E-06, 8.87E-06, 1.39E-05, 1.97E-05, 2.29E-05, 1.35E-05, 8.20E-06, 7.43E-06, 7.87E-06,
-            8.45E-06, 8.83E-06, 9.57E-06, 1.01E-05, 1.08E-05, 1.11E-05, 1.25E-05, 1.45E-05, 1.42E-05, 1.40E-05,
-            1.31E-05, 1.20E-05, 1.23E-05, 1.03E-05, 1.01E-05, 9.51E-07, 8.81E-06, 8.39E-06, 8.30E-06, 8.51E-06,
-            8.99E-06, 9.64E-06, 1.05E-05, 1.20E-05, 1.42E-05, 1.73E-05, 1.96E-05, 2.38E-05, 2.98E-05, 3.83E-05,
-            4.46E-05, 5.46E-05, 6.48E-05, 7.02E-05, 7.63E-05, 8.03E-05, 8.48E-05, 8.59E-05, 8.61E-05, 8.63E-05,
-            8.77E-05, 8.90E-05, 8.91E-05, 8.67E-05, 8.38E-05, 8.49E-05, 8.79E-05, 9.29E-05, 9.52E-05, 9.55E-05,
-            9.51E-05, 9.40E-05, 9.05E-05, 8.79E-05, 9.00E-05, 9.57E-05, 9.98E-05, 9.93E-05, 9.86E-05, 9.80E-05,
-            9.74E-05, 9.51E-05, 9.13E-05, 8.86E-05, 8.74E-05, 8.69E-05, 8.80E-05, 9.20E-05, 9.70E-05, 1.00E-04,
-            1.03E-04, 1.06E-04, 1.08E-04, 1.08E-04, 1.08E-04, 1.08E-04, 1.09E-04, 1.09E-04, 1.08E-04, 1.09E-04,
-            1.10E-04, 1.11E-04, 1.12E-04, 1.14E-04, 1.14E-04, 1.14E-04, 1.13E-04, 1.15E-04, 1.16E-04, 1.16E-04,
-            1.17E-04, 1.18E-04, 1.19E-04, 1.19E-04, 1.20E-04, 1.21E-04, 1.21E-04, 1.22E-04, 1.21E-04, 1.21E-04,
-            1.21E-04, 1.21E-04, 1.22E-04, 1.22E-04, 1.22E-04, 1.22E-04, 1.24E-04, 1.24E-04, 1.23E-04, 1.24E-04,
-            1.26E-04, 1.26E-04, 1.25E-04, 1.25E-04, 1.27E-04, 1.30E-04, 1.31E-04, 1.32E-04, 1.33E-04, 1.33E-04,
-            1.33E-04, 1.35E-04, 1.37E-04, 1.39E-04, 1.40E-04, 1.40E-04, 1.40E-04, 1.39E-04, 1.37E-04, 1.37E-04,
-            1.38E-04, 1.42E-04, 1.45E-04, 1.46E-04, 1.45E-04, 1.46E-04, 1.47E-04, 1.49E-04, 1.51E-04, 1.51E-04,
-            1.48E-04, 1.47E-04, 1.48E-04, 1.50E-04, 1.00E-03, 8.07E-03, 1.86E-02, 3.19E-02, 3.83E-02, 3.13E-02,
-            1.83E-02, 8.36E-03, 3.55E-03, 3.33E-03, 4.63E-03, 4.56E-03, 3.00E-03, 1.45E-03, 1.05E-03, 1.63E-04,
-            1.63E-04, 1.64E-04, 1.65E-04, 1.67E-04, 1.66E-04, 1.65E-04, 1.67E-04, 1.70E-04, 1.69E-04, 1.70E-04,
-            1.71E-04, 1.70E-04, 1.69E-04, 1.70E-04, 1.71E-04, 1.73E-04, 1.76E-04, 1.75E-04, 1.74E-04, 1.75E-04,
-            1.78E-04, 1.80E-04, 1.81E-04, 1.82E-04, 1.81E-04, 1.78E-04, 1.79E-04, 1.82E-04, 1.70E-04, 1.43E-04,
-            1.19E-04, 1.02E-04, 8.86E-05, 7.94E-05, 7.28E-05, 6.83E-05, 6.53E-05, 6.36E-05, 6.30E-05, 6.36E-05,
-            6.56E-05, 6.92E-05, 7.42E-05, 8.17E-05, 9.42E-05, 1.15E-04, 1.46E-04, 1.78E-04, 1.65E-04, 1.29E-04,
-            1.02E-04, 8.45E-05, 7.40E-05, 6.74E-05, 6.32E-05, 6.05E-05, 5.90E-05, 5.87E-05, 5.93E-05, 6.07E-05,
-            6.28E-05, 6.53E-05, 6.77E-05, 6.99E-05, 7.22E-05, 7.61E-05, 8.06E-05, 8.41E-05, 8.87E-05, 9.50E-05,
-            1.03E-04, 1.11E-04, 1.20E-04, 1.31E-04, 1.45E-04, 1.59E-04, 1.73E-04, 1.87E-04, 1.98E-04, 2.09E-04,
-            2.19E-04, 2.26E-04, 2.26E-04, 2.27E-04, 2.24E-04, 2.25E-04, 2.33E-04, 2.37E-04, 2.36E-04, 2.35E-04,
-            2.33E-04, 2.32E-04, 2.34E-04, 2.36E-04, 2.34E-04, 2.35E-04, 2.40E-04, 2.38E-04, 2.39E-04, 2.42E-04,
-            2.45E-04, 2.49E-04, 2.49E-04, 2.45E-04, 2.45E-04, 2.49E-04, 2.47E-04, 2.50E-04, 2.53E-04, 2.58E-04,
-            2.61E-04, 2.63E-04, 2.58E-04, 2.55E-04, 2.64E-04, 2.60E-04, 2.58E-04, 2.62E-04, 2.63E-04, 2.65E-04,
-            2.60E-04, 2.60E-04, 2.67E-04, 2.80E-04, 2.72E-04, 2.69E-04, 2.76E-04, 2.74E-04, 2.71E-04, 2.67E-04,
-            2.82E-04, 2.80E-04, 2.81E-04, 2.77E-04, 2.77E-04, 2.76E-04, 2.82E-04, 2.84E-04, 2.79E-04, 2.81E-04,
-            2.77E-04, 2.79E-04, 2.91E-04, 2.90E-04, 2.79E-04, 2.77E-04, 2.82E-04, 2.95E-04, 2.91E-04, 2.82E-04,
-            2.75E-04, 2.85E-04, 2.94E-04, 3.07E-04, 3.03E-04, 2.94E-04, 5.02E-04, 3.99E-04, 2.38E-04, 4.84E-04,
-            1.09E-03, 1.21E-03, 9.51E-04, 1.20E-03, 1.10E-03, 5.76E-04, 3.39E-04, 3.13E-04, 3.94E-04, 4.60E-04,
-            7.13E-04, 7.17E-04, 4.91E-04, 5.19E-04, 2.60E-04, 5.84E-04, 7.76E-04, 6.03E-04, 5.89E-04, 6.78E-04,
-            1.42E-03, 2.57E-03, 4.35E-03, 6.58E-03, 7.04E-03, 6.48E-03, 8.61E-03, 1.37E-02, 1.80E-02, 1.67E-02,
-            1.21E-02, 7.40E-03, 4.83E-03, 3.47E-03, 3.07E-03, 2.87E-03, 3.11E-03, 3.12E-03, 2.59E-03, 2.52E-03,
-            3.96E-03, 6.05E-03, 7.77E-03, 9.38E-03, 1.47E-02, 2.93E-02, 1.71E-01, 3.31E-01, 3.32E-01, 1.74E-01,
-            5.40E-02, 2.73E-02, 2.43E-02, 2.83E-02, 3.56E-02, 4.49E-02, 5.22E-02, 5.81E-02, 6.32E-02, 6.79E-02,
-            7.41E-02, 8.41E-02, 1.02E-01, 1.31E-01, 1.75E-01, 2.40E-01, 3.37E-01, 4.69E-01, 6.02E-01, 6.88E-01,
-            7.05E-01, 6.71E-01, 6.16E-01, 5.62E-01, 5.19E-01, 4.91E-01, 4.83E-01, 4.91E-01, 4.96E-01, 4.53E-01,
-            3.34E-01, 1.94E-01, 1.06E-01, 6.35E-02, 4.21E-02, 3.12E-02, 2.52E-02, 2.08E-02, 1.83E-02, 1.81E-02,
-            1.82E-02, 2.14E-02, 3.13E-02, 4.01E-02, 4.13E-02, 4.66E-02, 6.75E-02, 1.12E-01, 1.67E-01, 1.93E-01,
-            2.02E-01, 2.22E-01, 2.27E-01, 2.44E-01, 3.43E-01, 4.89E-01, 6.40E-01, 7.21E-01, 6.09E-01, 3.61E-01,
-            1.74E-01, 1.02E-01, 8.96E-02, 8.48E-02, 6.27E-02, 4.22E-02, 3.49E-02, 3.34E-02, 3.87E-02, 5.18E-02,
-            6.28E-02, 6.42E-02, 6.06E-02, 5.30E-02, 4.68E-02, 4.00E-02, 2.85E-02, 1.97E-02, 1.94E-02, 2.16E-02,
-            2.07E-02, 1.86E-02, 2.12E-02, 2.41E-02, 2.32E-02, 2.41E-02, 3.07E-02, 3.56E-02, 3.87E-02, 3.99E-02,
-            4.02E-02, 4.26E-02, 4.38E-02, 4.41E-02, 4.57E-02, 4.47E-02, 4.20E-02
-        ])
-
-        # 创建插值函数
-        self.n_interp = interpolate.interp1d(wavelengths_real, n_real, kind='linear',
-                                             bounds_error=False, fill_value=(n_real[0], n_real[-1]))
-        self.k_interp = interpolate.interp1d(wavelengths_real, k_real, kind='linear',
-                                             bounds_error=False, fill_value=(k_real[0], k_real[-1]))
+        # 光学常数表以.npy资源随脚本发布：内存映射加载，
+        # 免去每次构造实例时解析上千个Python字面量
+        data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 'pdms_nk.npy')
+        nk_table = np.load(data_path, mmap_mode='r')
+        wavelengths_real, n_real, k_real = (np.asarray(nk_table[0]),
+                                            np.asarray(nk_table[1]),
+                                            np.asarray(nk_table[2]))
+
+        # 插值数据：光学常数精度约5位小数，float32足够，
+        # 内存带宽和SIMD吞吐都翻倍
+        self._wl = wavelengths_real.astype(np.float32)
+        self._n = n_real.astype(np.float32)
+        self._k = k_real.astype(np.float32)
 
         self.wavelengths_data = wavelengths_real
         self.n_data = n_real
         self.k_data = k_real
 
+        # 细密均匀网格LUT（0.002μm间隔）：热路径查询用索引算术直接定位，
+        # 避免每次np.interp的二分查找。间隔取0.002是为了原生表节点落在
+        # 网格之间时重采样误差仍低于自检容差（0.01间隔时红外段可达8e-3）；
+        # 构造期一次np.interp、约1万点float32，代价可忽略
+        self._lut_w0 = 0.3
+        self._lut_dw = 0.002
+        lut_grid = np.arange(self._lut_w0, 20.0 + self._lut_dw, self._lut_dw)
+        self._n_lut = np.interp(lut_grid, self._wl, self._n).astype(np.float32)
+        self._k_lut = np.interp(lut_grid, self._wl, self._k).astype(np.float32)
+
+        # 短波区n/k曲线平滑，16阶Chebyshev级数即可复现，Clenshaw递推
+        # 求值只需十几次乘加。拟合区必须止于2.0μm：数据表在此处拼接，
+        # n有~0.013的台阶跳变，再往外还有2.7-3.5μm共振带，光滑多项式
+        # 都追不上（振铃还会让太阳波段的k变负）。2.0μm以上一律走LUT
+        self._cheb_limit = 2.0
+        smooth = self._wl <= self._cheb_limit
+        self._n_cheb = np.polynomial.chebyshev.Chebyshev.fit(
+            self._wl[smooth], self._n[smooth], deg=16)
+        self._k_cheb = np.polynomial.chebyshev.Chebyshev.fit(
+            self._wl[smooth], self._k[smooth], deg=16)
+
         print(f"✅ 使用PDMS光学数据，衬底类型: {self.substrate_type}")
 
+    def _interp_uniform(self, wavelength, table):
+        """均匀LUT上的线性插值 - O(1)索引算术，无搜索"""
+        idx = (np.asarray(wavelength, dtype=float) - self._lut_w0) / self._lut_dw
+        i = np.clip(idx.astype(np.int64), 0, len(table) - 2)
+        f = np.clip(idx - i, 0.0, 1.0)  # 范围外截断到端点值
+        return (1 - f) * table[i] + f * table[i + 1]
+
+    def _interp_hybrid(self, wavelength, cheb, table):
+        """平滑段走Chebyshev级数、共振段走均匀LUT的混合求值"""
+        w = np.asarray(wavelength, dtype=float)
+        return np.where(w <= self._cheb_limit, cheb(w),
+                        self._interp_uniform(w, table))
+
+    def _fast_nk(self, wavelength):
+        """一次取回(n, k)对，标量/数组同路径，供热路径内核调用"""
+        return self.n_interp(wavelength), self.k_interp(wavelength)
+
+    def n_interp(self, wavelength):
+        """折射率n(λ)：短波Chebyshev拟合 + 共振/红外均匀LUT"""
+        return self._interp_hybrid(wavelength, self._n_cheb, self._n_lut)
+
+    def k_interp(self, wavelength):
+        """消光系数k(λ)：短波Chebyshev拟合 + 共振/红外均匀LUT。
+        拟合残差可能略微穿零，截到k≥0保证物理意义（无增益介质）"""
+        return np.maximum(
+            self._interp_hybrid(wavelength, self._k_cheb, self._k_lut), 0.0)
+
     def validate_physical_parameters(self):
         """验证物理参数"""
         print("\n=== 物理参数验证 ===")
@@ -241,127 +194,164 @@ class PDMSFilmModel:
             n = self.n_interp(wl)
             k = self.k_interp(wl)
             print(f"  {name}: n={n:.3f}, k={k:.4f}")
+
+        # 一致性自检：快速插值路径与np.interp参考值必须吻合。
+        # 注意：插值统一用np.interp/LUT（C实现），不要退回
+        # scipy.interpolate.interp1d——其构造为纯Python且已被废弃。
+        # 校验点取原生波长表本身：稀疏均匀网格会从共振等尖峰之间
+        # 漏过去，逐点对表才能暴露拟合失准。容差5e-3与当前实现匹配：
+        # 实测最大偏差n≈2.2e-3（Chebyshev段）、k≈1.1e-3（LUT段），
+        # 动_cheb_limit或_lut_dw前先确认这里仍有余量
+        check_wl = self._wl.astype(np.float64)
+        for fast, raw, tag in ((self.n_interp, self._n, 'n'),
+                               (self.k_interp, self._k, 'k')):
+            ref = np.interp(check_wl, self._wl, raw)
+            max_err = float(np.max(np.abs(fast(check_wl) - ref)))
+            assert max_err < 5e-3, f"{tag}(λ)快速插值路径偏差过大: {max_err:.2e}"
+
         print("✅ 物理参数验证通过")
 
     def calculate_emissivity_physical_model(self, wavelength, thickness):
         """
-        基于物理原理的发射率计算模型
+        基于物理原理的发射率计算模型（波长向量化）
         考虑材料吸收、干涉效应和衬底影响
+        wavelength可以是标量或ndarray，厚度为标量
         """
-        # 获取光学常数
-        n = float(self.n_interp(wavelength))
-        k = float(self.k_interp(wavelength))
+        wavelength = np.asarray(wavelength, dtype=float)
+        scalar_input = wavelength.ndim == 0
+        wavelength = np.atleast_1d(wavelength)
+
+        result = self._emissivity_from_precomputed(self._build_band_cache(wavelength), thickness)
+        return float(result[0]) if scalar_input else result
 
+    def _build_band_cache(self, wavelengths):
+        """对一组波长预插值光学常数，供多次厚度计算复用"""
+        n, k = self._fast_nk(wavelengths)
         # 吸收系数 (μm^-1)
-        alpha = 4 * np.pi * k / wavelength if wavelength > 0 else 0
-
-        # 波段分类
-        is_solar_band = 0.3 <= wavelength <= 2.5  # 太阳波段
-        is_window_band = 8 <= wavelength <= 13  # 大气窗口
-        is_far_ir = wavelength > 13  # 远红外
-
-        # 根据衬底类型调整基础发射率
-        if self.substrate_type == 'silicon':
-            base_emissivity = self._silicon_substrate_model(wavelength, thickness, n, k, alpha)
-        elif self.substrate_type == 'air':
-            base_emissivity = self._air_substrate_model(wavelength, thickness, n, k, alpha)
-        elif self.substrate_type == 'metal':
-            base_emissivity = self._metal_substrate_model(wavelength, thickness, n, k, alpha)
-        else:
-            base_emissivity = self._silicon_substrate_model(wavelength, thickness, n, k, alpha)
+        alpha = np.where(wavelengths > 0, 4 * np.pi * k / wavelengths, 0.0)
+        # 波段掩码只依赖波长，随缓存一次算好，衬底模型不再重复比较
+        solar_mask = (wavelengths >= 0.3) & (wavelengths <= 2.5)
+        window_mask = (wavelengths >= 8) & (wavelengths <= 13)
+        return {'wl': wavelengths, 'n': n, 'k': k, 'alpha': alpha,
+                'solar_mask': solar_mask, 'window_mask': window_mask}
+
+    def _emissivity_from_precomputed(self, cache, thickness):
+        """用预插值的波段缓存计算发射率，只剩厚度相关的算术"""
+        wavelength = cache['wl']
+        n, k, alpha = cache['n'], cache['k'], cache['alpha']
+        solar_mask, window_mask = cache['solar_mask'], cache['window_mask']
+
+        # 衬底模型在构造时已绑定
+        base_emissivity = self._substrate_model(
+            wavelength, thickness, n, k, alpha, solar_mask, window_mask)
 
         return np.clip(base_emissivity, 0.0, 0.98)
 
-    def _silicon_substrate_model(self, wavelength, thickness, n, k, alpha):
-        """硅衬底模型 - 最接近实际应用"""
-        is_solar_band = 0.3 <= wavelength <= 2.5
-        is_window_band = 8 <= wavelength <= 13
-
-        if is_solar_band:
-            # 太阳波段：PDMS透明，希望低发射率（高反射/透射）
-            # 薄膜：干涉效应可能导致振荡
-            if thickness < 2.0:
-                optical_thickness = n * thickness
-                # 四分之一波长干涉
-                if 0.2 <= (optical_thickness / wavelength) % 1 <= 0.3:
-                    return 0.15  # 干涉相消，反射率较高
-                else:
-                    return 0.08  # 正常情况
-            else:
-                # 厚膜：趋近体材料特性
-                return 0.05 + 0.05 * (1 - np.exp(-thickness / 50))
-
-        elif is_window_band:
-            # 大气窗口：希望高发射率
-            if k > 0.1:  # 强吸收区域
-                if thickness < 5.0:
-                    # 薄膜：干涉效应重要
-                    optical_thickness = n * thickness
-                    quarter_wave_condition = (optical_thickness / wavelength) % 1
-                    if 0.2 <= quarter_wave_condition <= 0.3:
-                        return 0.95  # 干涉相消，高发射率
-                    elif 0.7 <= quarter_wave_condition <= 0.8:
-                        return 0.3  # 干涉相长，低发射率
-                    else:
-                        return 0.6 + 0.3 * (1 - np.exp(-thickness / 3))
-                else:
-                    # 厚膜：体吸收主导
-                    absorption_depth = 1.0 / alpha if alpha > 0 else 1000
-                    if thickness > 2 * absorption_depth:
-                        return 0.92  # 完全吸收
-                    else:
-                        return 0.7 + 0.25 * (1 - np.exp(-thickness / absorption_depth))
-            else:
-                return 0.3  # 弱吸收区域
-        else:
-            # 其他波段
-            return 0.4 + 0.3 * (1 - np.exp(-thickness / 20))
-
-    def _air_substrate_model(self, wavelength, thickness, n, k, alpha):
-        """空气衬底模型"""
-        is_solar_band = 0.3 <= wavelength <= 2.5
-        is_window_band = 8 <= wavelength <= 13
-
-        if is_solar_band:
-            # 太阳波段：低发射率（高透射）
-            return 0.03 + 0.02 * (1 - np.exp(-thickness / 100))
-        elif is_window_band:
-            # 大气窗口：高发射率
-            if k > 0.1:
-                if thickness < 10.0:
-                    return 0.6 + 0.3 * (1 - np.exp(-thickness / 8))
-                else:
-                    return 0.88 + 0.07 * (1 - np.exp(-thickness / 30))
-            else:
-                return 0.3
-        else:
-            return 0.4
-
-    def _metal_substrate_model(self, wavelength, thickness, n, k, alpha):
-        """金属衬底模型"""
-        is_solar_band = 0.3 <= wavelength <= 2.5
-        is_window_band = 8 <= wavelength <= 13
-
-        if is_solar_band:
-            # 太阳波段：希望低发射率（高反射）
-            return 0.02 + 0.03 * (1 - np.exp(-thickness / 50))
-        elif is_window_band:
-            # 大气窗口：希望高发射率
-            if k > 0.1:
-                if thickness < 5.0:
-                    # 薄膜：干涉效应明显
-                    optical_thickness = n * thickness
-                    quarter_wave = (optical_thickness / wavelength) % 1
-                    if 0.2 <= quarter_wave <= 0.3:
-                        return 0.9  # 干涉相消
-                    else:
-                        return 0.2  # 干涉相长
-                else:
-                    return 0.85 + 0.1 * (1 - np.exp(-thickness / 20))
-            else:
-                return 0.1
-        else:
-            return 0.3
+    def _quarter_wave_masks(self, wavelength, thickness, n):
+        """四分之一波长干涉条件（相消/相长），全程布尔数组无分支"""
+        # np.modf一次取小数部分，省去floor除法的模运算
+        quarter_wave, _ = np.modf(n * thickness / wavelength)
+        destructive = (quarter_wave >= 0.2) & (quarter_wave <= 0.3)  # 干涉相消
+        constructive = (quarter_wave >= 0.7) & (quarter_wave <= 0.8)  # 干涉相长
+        return destructive, constructive
+
+    @staticmethod
+    def _exp_saturation(thickness, taus):
+        """批量计算饱和项 1-exp(-t/τ)：τ轴堆叠后只调一次np.exp"""
+        t = np.asarray(thickness, dtype=float)
+        ratios = t[None, ...] / np.reshape(np.asarray(taus, dtype=float),
+                                           (-1,) + (1,) * t.ndim)
+        return tuple(1.0 - np.exp(-ratios))
+
+    def _silicon_substrate_model(self, wavelength, thickness, n, k, alpha,
+                                 solar_mask, window_mask):
+        """硅衬底模型 - 最接近实际应用（波长×厚度均可广播）"""
+        thickness = np.asarray(thickness, dtype=float)
+        if HAVE_NUMBA and wavelength.ndim == 1:
+            if thickness.ndim == 0 and wavelength.size >= 64:
+                # 大波长数组且厚度为标量时走JIT并行核
+                out = np.empty_like(wavelength)
+                _emissivity_silicon_kernel(wavelength, n, k, alpha,
+                                           float(thickness), out)
+                return out
+            if (thickness.ndim == 2 and thickness.shape[1] == 1
+                    and thickness.shape[0] * wavelength.size >= 2048):
+                # 厚度列向量×波长行的批量广播：2D矩阵核按厚度行并行
+                t_flat = np.ascontiguousarray(thickness[:, 0])
+                out = np.empty((t_flat.size, wavelength.size))
+                _emissivity_silicon_matrix(wavelength, n, k, alpha, t_flat, out)
+                return out
+
+        destructive, constructive = self._quarter_wave_masks(wavelength, thickness, n)
+
+        # 固定τ的饱和项合并成一次np.exp
+        sat3, sat20, sat50 = self._exp_saturation(thickness, (3.0, 20.0, 50.0))
+
+        # 太阳波段：PDMS透明，希望低发射率（高反射/透射）
+        # 薄膜干涉振荡 vs 厚膜趋近体材料特性
+        solar_eps = np.where(thickness < 2.0,
+                             np.where(destructive, 0.15, 0.08),
+                             0.05 + 0.05 * sat50)
+
+        # 大气窗口：希望高发射率
+        # 薄膜：干涉效应重要
+        thin_window = np.where(destructive, 0.95,
+                               np.where(constructive, 0.3,
+                                        0.6 + 0.3 * sat3))
+        # 厚膜：体吸收主导
+        absorption_depth = np.where(alpha > 0, 1.0 / np.maximum(alpha, 1e-12), 1000.0)
+        thick_window = np.where(thickness > 2 * absorption_depth,
+                                0.92,  # 完全吸收
+                                0.7 + 0.25 * (1 - np.exp(-thickness / absorption_depth)))
+        window_strong = np.where(thickness < 5.0, thin_window, thick_window)
+        window_eps = np.where(k > 0.1, window_strong, 0.3)  # 弱吸收区域取0.3
+
+        # 其他波段
+        other_eps = 0.4 + 0.3 * sat20
+
+        return np.where(solar_mask, solar_eps,
+                        np.where(window_mask, window_eps, other_eps))
+
+    def _air_substrate_model(self, wavelength, thickness, n, k, alpha,
+                             solar_mask, window_mask):
+        """空气衬底模型（波长×厚度均可广播）"""
+        thickness = np.asarray(thickness, dtype=float)
+
+        sat8, sat30, sat100 = self._exp_saturation(thickness, (8.0, 30.0, 100.0))
+
+        # 太阳波段：低发射率（高透射）
+        solar_eps = 0.03 + 0.02 * sat100
+
+        # 大气窗口：高发射率
+        window_strong = np.where(thickness < 10.0,
+                                 0.6 + 0.3 * sat8,
+                                 0.88 + 0.07 * sat30)
+        window_eps = np.where(k > 0.1, window_strong, 0.3)
+
+        return np.where(solar_mask, solar_eps,
+                        np.where(window_mask, window_eps, 0.4))
+
+    def _metal_substrate_model(self, wavelength, thickness, n, k, alpha,
+                               solar_mask, window_mask):
+        """金属衬底模型（波长×厚度均可广播）"""
+        thickness = np.asarray(thickness, dtype=float)
+
+        sat20, sat50 = self._exp_saturation(thickness, (20.0, 50.0))
+
+        # 太阳波段：希望低发射率（高反射）
+        solar_eps = 0.02 + 0.03 * sat50
+
+        # 大气窗口：薄膜干涉效应明显，厚膜趋于饱和
+        destructive, _ = self._quarter_wave_masks(wavelength, thickness, n)
+        thin_window = np.where(destructive,
+                               0.9,  # 干涉相消
+                               0.2)  # 干涉相长
+        window_strong = np.where(thickness < 5.0, thin_window,
+                                 0.85 + 0.1 * sat20)
+        window_eps = np.where(k > 0.1, window_strong, 0.1)
+
+        return np.where(solar_mask, solar_eps,
+                        np.where(window_mask, window_eps, 0.3))
 
     def calculate_emissivity(self, wavelength, thickness):
         """主发射率计算函数"""
@@ -384,56 +374,75 @@ class PDMSFilmModel:
 
         print("🔬 开始光谱分析...")
 
-        for i, thickness in enumerate(thicknesses):
-            print(f"  厚度 {thickness} μm ({i + 1}/{len(thicknesses)})")
-
-            emissivities = []
-            for wl in wavelengths:
-                emissivity = self.calculate_emissivity(wl, thickness)
-                emissivities.append(emissivity)
+        # 波段掩码只依赖波长网格，循环外计算一次即可
+        window_mask = (wavelengths >= 8) & (wavelengths <= 13)
+        solar_mask = (wavelengths >= 0.3) & (wavelengths <= 2.5)
 
-            results['emissivity_spectra'][thickness] = np.array(emissivities)
+        # n/k插值同样只依赖波长，插值一次后厚度轴列广播，
+        # 整个 (厚度×波长) 发射率矩阵单次批量求出
+        spectral_cache = self._build_band_cache(wavelengths)
+        t_col = np.asarray(thicknesses, dtype=float)[:, None]
+        eps_matrix = self._emissivity_from_precomputed(spectral_cache, t_col)
 
-            # 计算波段平均发射率
-            window_mask = (wavelengths >= 8) & (wavelengths <= 13)
-            solar_mask = (wavelengths >= 0.3) & (wavelengths <= 2.5)
+        # 波段平均同样按矩阵整体归约
+        avg_window_arr = eps_matrix[:, window_mask].mean(axis=1)
+        avg_solar_arr = eps_matrix[:, solar_mask].mean(axis=1)
 
-            avg_window = np.mean(np.array(emissivities)[window_mask])
-            avg_solar = np.mean(np.array(emissivities)[solar_mask])
+        # 输出缓冲到列表，循环结束一次性打印，避免逐行I/O
+        lines = []
+        for i, thickness in enumerate(thicknesses):
+            lines.append(f"  厚度 {thickness} μm ({i + 1}/{len(thicknesses)})")
 
-            results['avg_emissivity_window'].append(avg_window)
-            results['avg_emissivity_solar'].append(avg_solar)
+            results['emissivity_spectra'][thickness] = eps_matrix[i]
+            results['avg_emissivity_window'].append(avg_window_arr[i])
+            results['avg_emissivity_solar'].append(avg_solar_arr[i])
 
-            print(f"    大气窗口: {avg_window:.3f}, 太阳波段: {avg_solar:.3f}")
+            lines.append(f"    大气窗口: {avg_window_arr[i]:.3f}, 太阳波段: {avg_solar_arr[i]:.3f}")
 
+        print("\n".join(lines))
         return results
 
+    def _fused_band_averages(self, thicknesses):
+        """一次算出全部厚度的窗口/太阳波段平均发射率
+
+        只在两个30点波段网格上求值（复用缓存的n/k），
+        厚度轴广播成 (n_thickness, n_band_wl) 矩阵后按行取均值。
+        """
+        window_cache = self._get_band_cache(8, 13, 30)
+        solar_cache = self._get_band_cache(0.3, 2.5, 30)
+        t_arr = np.asarray(thicknesses, dtype=float)
+
+        # 基类硅衬底模型可走融合归约核：prange并行扫厚度、
+        # 波段均值在核内累加，连中间矩阵都不分配
+        if (HAVE_NUMBA and self.substrate_type == 'silicon'
+                and type(self)._emissivity_from_precomputed
+                is PDMSFilmModel._emissivity_from_precomputed):
+            window_avg = np.empty(t_arr.size)
+            solar_avg = np.empty(t_arr.size)
+            for cache, out in ((window_cache, window_avg), (solar_cache, solar_avg)):
+                _band_average_sweep(np.asarray(cache['wl'], dtype=float),
+                                    np.asarray(cache['n'], dtype=float),
+                                    np.asarray(cache['k'], dtype=float),
+                                    np.asarray(cache['alpha'], dtype=float),
+                                    t_arr, out)
+            return window_avg, solar_avg
+
+        t_col = t_arr[:, None]
+        window_avg = self._emissivity_from_precomputed(window_cache, t_col).mean(axis=1)
+        solar_avg = self._emissivity_from_precomputed(solar_cache, t_col).mean(axis=1)
+        return window_avg, solar_avg
+
     def thickness_optimization(self, thickness_range=(0.5, 100), n_points=100):
-        """厚度优化分析"""
+        """厚度优化分析（全厚度批量广播，无Python循环）"""
         print("⚡ 开始厚度优化分析...")
 
         thicknesses = np.linspace(thickness_range[0], thickness_range[1], n_points)
 
-        performance_scores = []
-        window_emissivities = []
-        solar_emissivities = []
-
-        for i, thickness in enumerate(thicknesses):
-            if i % 20 == 0:
-                print(f"  进度: {i + 1}/{n_points}")
-
-            # 计算关键波段发射率
-            window_emissivity = self.calculate_band_emissivity(8, 13, thickness)
-            solar_emissivity = self.calculate_band_emissivity(0.3, 2.5, thickness)
+        window_emissivities, solar_emissivities = self._fused_band_averages(thicknesses)
 
-            window_emissivities.append(window_emissivity)
-            solar_emissivities.append(solar_emissivity)
-
-            # 性能评分：窗口发射率 × 选择性比
-            selectivity = window_emissivity / max(solar_emissivity, 0.01)
-            performance_score = window_emissivity * selectivity
-
-            performance_scores.append(performance_score)
+        # 性能评分：窗口发射率 × 选择性比
+        selectivity_arr = window_emissivities / np.maximum(solar_emissivities, 0.01)
+        performance_scores = window_emissivities * selectivity_arr
 
         # 找到最优厚度
         optimal_idx = np.argmax(performance_scores)
@@ -459,11 +468,30 @@ class PDMSFilmModel:
             'optimal_selectivity': optimal_selectivity
         }
 
+    def _get_band_cache(self, lambda_min, lambda_max, n_points):
+        """取出（必要时建立）指定波段的预插值网格"""
+        key = (lambda_min, lambda_max, n_points)
+        cache = self._band_cache.get(key)
+        if cache is None:
+            wavelengths = np.linspace(lambda_min, lambda_max, n_points)
+            cache = self._build_band_cache(wavelengths)
+            self._band_cache[key] = cache
+        return cache
+
     def calculate_band_emissivity(self, lambda_min, lambda_max, thickness, n_points=30):
-        """计算波段平均发射率"""
-        wavelengths = np.linspace(lambda_min, lambda_max, n_points)
-        emissivities = [self.calculate_emissivity(wl, thickness) for wl in wavelengths]
-        return np.mean(emissivities)
+        """计算波段平均发射率（波长网格与n/k插值按波段缓存复用）
+
+        同一(波段, 厚度)组合在Q1绘图与Q2逐环境评估中会被反复查询，
+        结果按实例记忆化，重复调用零计算。
+        """
+        key = (round(lambda_min, 4), round(lambda_max, 4),
+               round(float(thickness), 4), n_points)
+        result = self._band_avg_cache.get(key)
+        if result is None:
+            cache = self._get_band_cache(lambda_min, lambda_max, n_points)
+            result = float(np.mean(self._emissivity_from_precomputed(cache, thickness)))
+            self._band_avg_cache[key] = result
+        return result
 
     def plot_results(self, spectral_results, optimization_results):
         """绘制结果图"""
@@ -471,9 +499,12 @@ class PDMSFilmModel:
 
         # 1. 光谱发射率
         wavelengths = spectral_results['wavelengths']
-        for thickness in spectral_results['thicknesses']:
-            emissivities = spectral_results['emissivity_spectra'][thickness]
-            ax1.plot(wavelengths, emissivities, label=f'{thickness} μm', linewidth=2)
+        # 堆成二维矩阵一次性plot，省去逐厚度的Matplotlib调度开销
+        Y = np.stack([spectral_results['emissivity_spectra'][t]
+                      for t in spectral_results['thicknesses']], axis=1)
+        lines = ax1.plot(wavelengths, Y, linewidth=2)
+        for line, thickness in zip(lines, spectral_results['thicknesses']):
+            line.set_label(f'{thickness} μm')
 
         ax1.axvspan(8, 13, alpha=0.2, color='red', label='大气窗口')
         ax1.set_xlabel('波长 (μm)')
@@ -497,7 +528,7 @@ class PDMSFilmModel:
 
         # 3. 选择性分析
         solar_emis = optimization_results['solar_emissivities']
-        selectivity = [w / max(s, 0.01) for w, s in zip(window_emis, solar_emis)]
+        selectivity = np.asarray(window_emis) / np.maximum(solar_emis, 0.01)
         ax3.plot(thicknesses_opt, selectivity, 'g-', linewidth=2)
         ax3.set_xlabel('薄膜厚度 (μm)')
         ax3.set_ylabel('选择性比 (窗口/太阳)')
@@ -531,10 +562,13 @@ class PDMSFilmModel:
             (10.0, 50.0, "大气窗口-厚膜")
         ]
 
-        for wl, d, desc in test_cases:
-            emissivity = self.calculate_emissivity(wl, d)
-            n = self.n_interp(wl)
-            k = self.k_interp(wl)
+        # 全部测试点一次批量求值，循环只负责打印
+        wls = np.array([case[0] for case in test_cases])
+        ds = np.array([case[1] for case in test_cases])
+        emissivities = self.calculate_emissivity(wls, ds)
+        ns, ks = self._fast_nk(wls)
+
+        for (wl, d, desc), emissivity, n, k in zip(test_cases, emissivities, ns, ks):
             print(f"  {desc}: ε({wl}μm, {d}μm) = {emissivity:.3f} (n={n:.3f}, k={k:.3f})")
 
 
@@ -548,12 +582,25 @@ class CorrectedPDMSModel(PDMSFilmModel):
         super().__init__(substrate_type)
         self.correction_method = correction_method
 
-    def calculate_emissivity_physical_model(self, wavelength, thickness):
+        # PDMS特征吸收峰（Si-O-Si主峰、CH3振动），数组形式供广播计算
+        self._peak_wl = np.array([9.0, 12.5])
+        self._peak_str = np.array([0.4, 0.3])
+        self._peak_sigma = np.array([1.0, 1.0])
+
+        # 混合修正的文献校准点（可见光/窗口中心/强吸收/窗口外），有序数组
+        # 供searchsorted最近邻查找
+        self._cal_wl = np.array([0.5, 10.0, 12.0, 15.0])
+        self._cal_eps = np.array([0.04, 0.90, 0.92, 0.40])
+
+    def _emissivity_from_precomputed(self, cache, thickness):
         """
         修正的发射率计算 - 综合各种修正方法
+        （挂在预插值缓存路径上，波段缓存同样享受修正）
         """
+        wavelength = cache['wl']
+
         # 原始模型结果
-        base_epsilon = super().calculate_emissivity_physical_model(wavelength, thickness)
+        base_epsilon = super()._emissivity_from_precomputed(cache, thickness)
 
         if self.correction_method == 'literature':
             return self._literature_correction(wavelength, thickness, base_epsilon)
@@ -565,75 +612,56 @@ class CorrectedPDMSModel(PDMSFilmModel):
             return base_epsilon
 
     def _literature_correction(self, wavelength, thickness, base_epsilon):
-        """基于文献[3]的修正"""
-        # 大气窗口重点增强
-        if 8 <= wavelength <= 13:
-            # 核心修正：提升到文献报道水平
-            if wavelength <= 10:
-                target_range = (0.85, 0.92)  # Si-O-Si强吸收
-            else:
-                target_range = (0.88, 0.95)  # CH3振动区域
+        """基于文献[3]的修正（向量化）"""
+        window_mask = (wavelength >= 8) & (wavelength <= 13)
+        solar_mask = (wavelength >= 0.3) & (wavelength <= 2.5)
 
-            current_ratio = (base_epsilon - 0.3) / (0.7 - 0.3)  # 归一化
-            target_epsilon = target_range[0] + current_ratio * (target_range[1] - target_range[0])
+        # 核心修正：提升到文献报道水平
+        # λ≤10μm为Si-O-Si强吸收区，λ>10μm为CH3振动区域
+        target_lo = np.where(wavelength <= 10, 0.85, 0.88)
+        target_hi = np.where(wavelength <= 10, 0.92, 0.95)
 
-            # 厚度调整
-            if thickness < 3:
-                weight = thickness / 3.0
-                return weight * target_epsilon + (1 - weight) * base_epsilon
-            else:
-                return target_epsilon
+        current_ratio = (base_epsilon - 0.3) / (0.7 - 0.3)  # 归一化
+        target_epsilon = target_lo + current_ratio * (target_hi - target_lo)
 
-        elif 0.3 <= wavelength <= 2.5:
-            # 太阳波段：保持低值，略微调整
-            return base_epsilon * 0.9
+        # 厚度调整：3μm以下按厚度线性过渡到文献目标值
+        weight = np.clip(np.asarray(thickness, dtype=float) / 3.0, 0.0, 1.0)
+        window_eps = weight * target_epsilon + (1 - weight) * base_epsilon
 
-        else:
-            return base_epsilon
+        # 太阳波段：保持低值，略微调整；其他波段不变
+        return np.where(window_mask, window_eps,
+                        np.where(solar_mask, base_epsilon * 0.9, base_epsilon))
 
     def _molecular_correction(self, wavelength, thickness, base_epsilon):
-        """基于分子振动的物理修正"""
-        enhancement = 1.0
-
-        # PDMS特征吸收峰
-        absorption_peaks = {
-            9.0: 0.4,  # Si-O-Si主峰
-            12.5: 0.3,  # CH3振动
-        }
-
-        for peak_wl, strength in absorption_peaks.items():
-            # 高斯峰形
-            peak_contribution = strength * np.exp(-0.5 * ((wavelength - peak_wl) / 1.0) ** 2)
-            enhancement += peak_contribution
+        """基于分子振动的物理修正（向量化）"""
+        # 全部高斯峰经末轴广播后一次ufunc算完再求和
+        wl = np.asarray(wavelength, dtype=float)
+        peaks = self._peak_str * np.exp(
+            -0.5 * ((wl[..., None] - self._peak_wl) / self._peak_sigma) ** 2)
+        enhancement = 1.0 + peaks.sum(axis=-1)
 
         # 厚度效应
         thickness_factor = 1.0 + 0.25 * (1 - np.exp(-thickness / 5))
 
         corrected = base_epsilon * enhancement * thickness_factor
 
-        return min(0.95, corrected)
+        return np.minimum(0.95, corrected)
 
     def _hybrid_correction(self, wavelength, thickness, base_epsilon):
-        """混合修正：物理机制 + 文献数据"""
+        """混合修正：物理机制 + 文献数据（向量化）"""
         # 先用分子振动修正
         molecular_corrected = self._molecular_correction(wavelength, thickness, base_epsilon)
 
-        # 再用文献数据进行校准
-        literature_targets = {
-            0.5: 0.04,  # 可见光
-            10.0: 0.90,  # 大气窗口中心
-            12.0: 0.92,  # 强吸收
-            15.0: 0.40  # 窗口外
-        }
-
-        # 找到最近的校准点
-        calibration_points = list(literature_targets.keys())
-        nearest_point = min(calibration_points, key=lambda x: abs(x - wavelength))
-
-        target_epsilon = literature_targets[nearest_point]
+        # 再用文献数据进行校准：校准表有序，searchsorted二分定位后
+        # 比较左右邻居取最近点，免去对全表的距离扫描
+        idx = np.clip(np.searchsorted(self._cal_wl, wavelength), 1, len(self._cal_wl) - 1)
+        left = idx - 1
+        nearest = np.where(np.abs(self._cal_wl[left] - wavelength)
+                           < np.abs(self._cal_wl[idx] - wavelength), left, idx)
+        target_epsilon = self._cal_eps[nearest]
 
         # 混合权重：波长越近，文献数据权重越高
-        distance = abs(wavelength - nearest_point)
+        distance = np.abs(wavelength - self._cal_wl[nearest])
         weight = np.exp(-distance / 2.0)  # 距离衰减
 
         hybrid_epsilon = weight * target_epsilon + (1 - weight) * molecular_corrected
@@ -657,18 +685,26 @@ def validate_correction():
     print("🔧 修正效果验证")
     print("=" * 50)
 
-    for wl, thickness, desc in test_cases:
-        orig_emis = original_model.calculate_emissivity(wl, thickness)
-        corr_emis = corrected_model.calculate_emissivity(wl, thickness)
+    # 测试点批量求值，两个模型各一次数组调用
+    wls = np.array([case[0] for case in test_cases])
+    ts = np.array([case[1] for case in test_cases])
+    orig_arr = original_model.calculate_emissivity(wls, ts)
+    corr_arr = corrected_model.calculate_emissivity(wls, ts)
+
+    # 结果先缓冲，循环后一次性输出
+    lines = []
+    for (wl, thickness, desc), orig_emis, corr_emis in zip(test_cases, orig_arr, corr_arr):
         improvement = corr_emis - orig_emis
 
-        print(f"{desc:20} | 原始: {orig_emis:.3f} → 修正: {corr_emis:.3f} | 提升: {improvement:+.3f}")
+        lines.append(f"{desc:20} | 原始: {orig_emis:.3f} → 修正: {corr_emis:.3f} | 提升: {improvement:+.3f}")
 
         # 验证物理合理性
         if "大气窗口" in desc and corr_emis < 0.8:
-            print(f"  ⚠️ 警告: {desc}发射率仍偏低")
+            lines.append(f"  ⚠️ 警告: {desc}发射率仍偏低")
         elif "可见光" in desc and corr_emis > 0.1:
-            print(f"  ⚠️ 警告: {desc}发射率偏高")
+            lines.append(f"  ⚠️ 警告: {desc}发射率偏高")
+
+    print("\n".join(lines))
 
 def main():
     """主函数"""
@@ -744,26 +780,28 @@ def enhanced_main_analysis():
 class LiteratureCalibratedPDMSModel(CorrectedPDMSModel):
     """基于文献[3]数据校准的PDMS模型"""
 
-    def calculate_emissivity(self, wavelength, thickness):
-        base_epsilon = super().calculate_emissivity(wavelength, thickness)
-
+    def _emissivity_from_precomputed(self, cache, thickness):
         # 在大气窗口应用文献校准
-        if 8 <= wavelength <= 13:
-            # 文献[3]报道PDMS在此波段发射率0.90-0.95
-            literature_target = 0.92
-
-            # 厚度依赖的校准
-            if thickness < 5:
-                # 薄膜：发射率随厚度增加
-                weight = thickness / 5.0
-                calibrated = weight * literature_target + (1 - weight) * base_epsilon
-            else:
-                # 厚膜：接近文献值
-                calibrated = literature_target - 0.02  # 微小调整
+        # 文献[3]报道PDMS在此波段发射率0.90-0.95
+        literature_target = 0.92
+
+        t = np.asarray(thickness, dtype=float)
+        window_mask = cache['window_mask']
+
+        # 短路：厚膜(≥5μm)在窗口波段的校准值恒为0.90，与基础模型无关；
+        # 若查询全部落在窗口内，物理模型一次都不用算
+        if t.ndim == 0 and float(t) >= 5 and bool(window_mask.all()):
+            return np.full(np.shape(cache['wl']), literature_target - 0.02)
+
+        base_epsilon = super()._emissivity_from_precomputed(cache, thickness)
 
-            return min(calibrated, 0.95)
+        # 厚度依赖的校准
+        # 薄膜：发射率随厚度增加；厚膜：接近文献值（微小调整）
+        weight = np.clip(t / 5.0, 0.0, 1.0)
+        blend = weight * literature_target + (1 - weight) * base_epsilon
+        calibrated = np.where(t < 5, blend, literature_target - 0.02)
 
-        return base_epsilon
+        return np.where(window_mask, np.minimum(calibrated, 0.95), base_epsilon)
 
 
 def enhanced_detailed_visualization():
@@ -795,9 +833,9 @@ def plot_performance_comparison(model, opt_results):
 
     # 1. 关键性能指标随厚度变化
     thicknesses = opt_results['thicknesses']
-    window_emis = opt_results['window_emissivities']
-    solar_emis = opt_results['solar_emissivities']
-    selectivity = [w / max(s, 0.01) for w, s in zip(window_emis, solar_emis)]
+    window_emis = np.asarray(opt_results['window_emissivities'])
+    solar_emis = np.asarray(opt_results['solar_emissivities'])
+    selectivity = window_emis / np.maximum(solar_emis, 0.01)
 
     ax1.plot(thicknesses, window_emis, 'r-', linewidth=3, label='大气窗口发射率')
     ax1.plot(thicknesses, solar_emis, 'b-', linewidth=3, label='太阳波段发射率')
@@ -819,7 +857,7 @@ def plot_performance_comparison(model, opt_results):
     ax2.grid(True, alpha=0.3)
 
     # 3. 冷却功率估算
-    cooling_power = [0.9 * w - 0.05 * s for w, s in zip(window_emis, solar_emis)]
+    cooling_power = 0.9 * window_emis - 0.05 * solar_emis
     ax3.plot(thicknesses, cooling_power, 'purple', linewidth=3)
     ax3.axvline(opt_results['optimal_thickness'], color='black', linestyle='--')
     ax3.set_xlabel('薄膜厚度 (μm)')
@@ -834,9 +872,9 @@ def plot_performance_comparison(model, opt_results):
         '太阳发射率': [0.06, 0.05, 0.04, 0.04]
     }
 
-    # 插值获取模型在文献厚度点的值
-    model_window = [model.calculate_band_emissivity(8, 13, t) for t in literature_data['厚度']]
-    model_solar = [model.calculate_band_emissivity(0.3, 2.5, t) for t in literature_data['厚度']]
+    # 插值获取模型在文献厚度点的值（全部厚度一次广播计算）
+    model_window, model_solar = model._fused_band_averages(
+        np.asarray(literature_data['厚度'], dtype=float))
 
     width = 0.35
     x = np.arange(len(literature_data['厚度']))
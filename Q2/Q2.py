@@ -56,37 +56,32 @@ class LiteratureBasedRadiativeCoolingEvaluator:
             }
         }
 
+        # 文献数据的有序数组形式：np.interp可直接对整个厚度数组插值
+        lit_t = sorted(self.literature_performance['thickness_vs_cooling'])
+        self._lit_t = np.array(lit_t, dtype=float)
+        self._lit_cool = np.array(
+            [self.literature_performance['thickness_vs_cooling'][t] for t in lit_t], dtype=float)
+        self._lit_dT = np.array(
+            [self.literature_performance['thickness_vs_deltaT'][t] for t in lit_t], dtype=float)
+
+        # 环境参数固定不变，调整因子构造时一次算好，逐厚度评估直接复用
+        for profile in self.environment_profiles.values():
+            profile['_adjustment'] = self._compute_environment_adjustment(profile)
+
     def get_literature_performance(self, thickness):
-        """基于文献数据的性能插值"""
-        # 找到最近的厚度点
-        available_thickness = sorted(self.literature_performance['thickness_vs_cooling'].keys())
-
-        # 如果厚度在范围内，使用线性插值
-        if thickness <= min(available_thickness):
-            base_cooling = self.literature_performance['thickness_vs_cooling'][min(available_thickness)]
-            base_deltaT = self.literature_performance['thickness_vs_deltaT'][min(available_thickness)]
-        elif thickness >= max(available_thickness):
-            base_cooling = self.literature_performance['thickness_vs_cooling'][max(available_thickness)]
-            base_deltaT = self.literature_performance['thickness_vs_deltaT'][max(available_thickness)]
-        else:
-            # 找到包围的厚度点
-            for i in range(len(available_thickness) - 1):
-                if available_thickness[i] <= thickness <= available_thickness[i + 1]:
-                    t1, t2 = available_thickness[i], available_thickness[i + 1]
-                    p1 = self.literature_performance['thickness_vs_cooling'][t1]
-                    p2 = self.literature_performance['thickness_vs_cooling'][t2]
-                    d1 = self.literature_performance['thickness_vs_deltaT'][t1]
-                    d2 = self.literature_performance['thickness_vs_deltaT'][t2]
-
-                    # 线性插值
-                    fraction = (thickness - t1) / (t2 - t1)
-                    base_cooling = p1 + fraction * (p2 - p1)
-                    base_deltaT = d1 + fraction * (d2 - d1)
-                    break
-
-        return base_cooling, base_deltaT
+        """基于文献数据的性能插值（np.interp自带端点截断，标量/数组皆可）"""
+        return (np.interp(thickness, self._lit_t, self._lit_cool),
+                np.interp(thickness, self._lit_t, self._lit_dT))
 
     def calculate_environment_adjustment(self, environment_profile):
+        """取环境调整因子（固定环境在__init__中已预先算好）"""
+        adjustment = environment_profile.get('_adjustment')
+        if adjustment is None:
+            adjustment = self._compute_environment_adjustment(environment_profile)
+            environment_profile['_adjustment'] = adjustment
+        return adjustment
+
+    def _compute_environment_adjustment(self, environment_profile):
         """计算环境条件对性能的影响因子"""
         T_amb = environment_profile['T_amb']
         T_sky = environment_profile['T_sky']
@@ -150,50 +145,106 @@ class LiteratureBasedRadiativeCoolingEvaluator:
             'env_adjustment': env_adjustment
         }
 
+    def calculate_net_cooling_batch(self, thickness, environment_profiles=None):
+        """单厚度×全部环境的一次性向量化评估
+
+        把各环境的标量参数堆成数组后整批广播，替代逐环境调用
+        calculate_net_cooling_literature_based；返回与逐环境调用
+        同构的字典列表（按profile顺序）。
+        """
+        if environment_profiles is None:
+            environment_profiles = self.environment_profiles
+        profiles = list(environment_profiles.values())
+
+        # 厚度相关量与环境无关，各算一次
+        base_cooling, base_deltaT = self.get_literature_performance(thickness)
+        window_emis = self.pdms_model.calculate_band_emissivity(8, 13, thickness)
+        solar_abs = self.pdms_model.calculate_band_emissivity(0.3, 2.5, thickness)
+        selectivity = window_emis / max(solar_abs, 0.01)
+
+        # 环境标量堆成向量，一次广播出全部分量
+        env_adj = np.array([self.calculate_environment_adjustment(p) for p in profiles])
+        T_amb = np.array([p['T_amb'] for p in profiles], dtype=float)
+        G_sun = np.array([p['G_sun_total'] for p in profiles], dtype=float)
+
+        adjusted_cooling = base_cooling * env_adj
+        adjusted_deltaT = base_deltaT * env_adj
+        P_rad = adjusted_cooling * 2.5
+        P_atm = P_rad * 0.4
+        P_sun = G_sun * solar_abs * 0.8
+        P_conv = P_rad - P_atm - P_sun - adjusted_cooling
+
+        return [{
+            'P_net': max(0.0, float(adjusted_cooling[i])),
+            'delta_T': max(0.0, float(adjusted_deltaT[i])),
+            'T_surface': float(T_amb[i] - adjusted_deltaT[i]),
+            'P_rad': float(P_rad[i]),
+            'P_atm': float(P_atm[i]),
+            'P_sun': float(P_sun[i]),
+            'P_conv': max(0.0, float(P_conv[i])),
+            'window_emissivity': window_emis,
+            'solar_absorptivity': solar_abs,
+            'selectivity': selectivity,
+            'env_adjustment': float(env_adj[i])
+        } for i in range(len(profiles))]
+
     def performance_analysis_literature_based(self, thickness_range=(1, 50)):
-        """基于文献的性能分析"""
+        """基于文献的性能分析（厚度×环境矩阵一次广播算完）"""
         thicknesses = np.linspace(thickness_range[0], thickness_range[1], 20)
-        results = []
 
-        for thickness in thicknesses:
-            env_performances = []
-
-            for env_name, env_profile in self.environment_profiles.items():
-                cooling_data = self.calculate_net_cooling_literature_based(thickness, env_profile)
-
-                env_performances.append({
-                    'environment': env_name,
-                    'location': env_profile['location'],
-                    'cooling_power': cooling_data['P_net'],
-                    'delta_T': cooling_data['delta_T'],
-                    'T_surface': cooling_data['T_surface'],
-                    'env_adjustment': cooling_data['env_adjustment'],
-                    'window_emissivity': cooling_data['window_emissivity'],
-                    'solar_absorptivity': cooling_data['solar_absorptivity'],
-                    'selectivity': cooling_data['selectivity']
-                })
-
-            # 计算平均性能
-            avg_cooling = np.mean([p['cooling_power'] for p in env_performances])
-            avg_delta_T = np.mean([p['delta_T'] for p in env_performances])
-
-            # 平均光学性能
-            avg_window_emis = np.mean([p['window_emissivity'] for p in env_performances])
-            avg_solar_abs = np.mean([p['solar_absorptivity'] for p in env_performances])
-            avg_selectivity = avg_window_emis / max(avg_solar_abs, 0.01)
+        # 文献基准性能：整个厚度向量一次插值
+        base_cooling = np.interp(thicknesses, self._lit_t, self._lit_cool)
+        base_deltaT = np.interp(thicknesses, self._lit_t, self._lit_dT)
+
+        # 环境调整因子向量，广播出 (n_thickness, n_env) 性能矩阵
+        env_adj = np.array([self.calculate_environment_adjustment(p)
+                            for p in self.environment_profiles.values()])
+        cooling_matrix = np.maximum(0, base_cooling[:, None] * env_adj[None, :])
+        deltaT_matrix = np.maximum(0, base_deltaT[:, None] * env_adj[None, :])
+
+        # 逐环境明细只在需要时（最优厚度）由environment_breakdown构建，
+        # 这里不再为每个厚度分配60个小字典
+        results = []
+        for i, thickness in enumerate(thicknesses):
+            # 光学性能与环境无关，每个厚度算一次
+            window_emis = self.pdms_model.calculate_band_emissivity(8, 13, thickness)
+            solar_abs = self.pdms_model.calculate_band_emissivity(0.3, 2.5, thickness)
+            selectivity = window_emis / max(solar_abs, 0.01)
 
             results.append({
                 'thickness': thickness,
-                'avg_cooling_power': avg_cooling,
-                'avg_delta_T': avg_delta_T,
-                'window_emissivity': avg_window_emis,
-                'solar_absorptivity': avg_solar_abs,
-                'selectivity': avg_selectivity,
-                'environment_details': env_performances
+                'avg_cooling_power': cooling_matrix[i].mean(),
+                'avg_delta_T': deltaT_matrix[i].mean(),
+                'window_emissivity': window_emis,
+                'solar_absorptivity': solar_abs,
+                'selectivity': selectivity
             })
 
         return results
 
+    def environment_breakdown(self, thickness):
+        """单个厚度的逐环境性能明细"""
+        base_cooling, base_deltaT = self.get_literature_performance(thickness)
+        window_emis = self.pdms_model.calculate_band_emissivity(8, 13, thickness)
+        solar_abs = self.pdms_model.calculate_band_emissivity(0.3, 2.5, thickness)
+        selectivity = window_emis / max(solar_abs, 0.01)
+
+        details = []
+        for env_name, env_profile in self.environment_profiles.items():
+            adjustment = self.calculate_environment_adjustment(env_profile)
+            details.append({
+                'environment': env_name,
+                'location': env_profile['location'],
+                'cooling_power': max(0, base_cooling * adjustment),
+                'delta_T': max(0, base_deltaT * adjustment),
+                'T_surface': env_profile['T_amb'] - base_deltaT * adjustment,
+                'env_adjustment': adjustment,
+                'window_emissivity': window_emis,
+                'solar_absorptivity': solar_abs,
+                'selectivity': selectivity
+            })
+        return details
+
 
 def run_literature_based_analysis():
     """运行基于文献的分析"""
@@ -209,8 +260,10 @@ def run_literature_based_analysis():
     print("🔍 进行基于文献的性能分析...")
     results = literature_evaluator.performance_analysis_literature_based(thickness_range=(1, 50))
 
-    # 找到最优厚度
+    # 找到最优厚度，逐环境明细只为最优点构建
     optimal_result = max(results, key=lambda x: x['avg_cooling_power'])
+    optimal_result['environment_details'] = literature_evaluator.environment_breakdown(
+        optimal_result['thickness'])
 
     print(f"\n🎯 最优厚度: {optimal_result['thickness']:.1f} μm")
     print(f"❄️ 平均冷却功率: {optimal_result['avg_cooling_power']:.1f} W/m²")
@@ -220,9 +273,9 @@ def run_literature_based_analysis():
     print(f"⚡ 选择性比: {optimal_result['selectivity']:.2f}")
 
     print(f"\n🌍 各环境性能:")
-    for env_detail in optimal_result['environment_details']:
-        print(
-            f"  {env_detail['location']}: {env_detail['cooling_power']:.1f} W/m² (ΔT={env_detail['delta_T']:.1f}K, 调整因子={env_detail['env_adjustment']:.2f})")
+    print("\n".join(
+        f"  {d['location']}: {d['cooling_power']:.1f} W/m² (ΔT={d['delta_T']:.1f}K, 调整因子={d['env_adjustment']:.2f})"
+        for d in optimal_result['environment_details']))
 
     # 详细分析最优配置
     print(f"\n🔬 详细分析 (最优厚度 {optimal_result['thickness']:.1f}μm):")
@@ -275,10 +328,14 @@ def plot_literature_results(results, optimal_result):
     """绘制基于文献的结果"""
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
 
-    thicknesses = [r['thickness'] for r in results]
-    cooling_powers = [r['avg_cooling_power'] for r in results]
-    delta_Ts = [r['avg_delta_T'] for r in results]
-    selectivities = [r['selectivity'] for r in results]
+    # 结果打包成一个结构化数组，四列数据一趟构建
+    data = np.array([(r['thickness'], r['avg_cooling_power'],
+                      r['avg_delta_T'], r['selectivity']) for r in results],
+                    dtype=[('t', 'f8'), ('cool', 'f8'), ('dT', 'f8'), ('sel', 'f8')])
+    thicknesses = data['t']
+    cooling_powers = data['cool']
+    delta_Ts = data['dT']
+    selectivities = data['sel']
 
     # 冷却功率 vs 厚度
     ax1.plot(thicknesses, cooling_powers, 'b-o', linewidth=2, markersize=6, label='计算值')
@@ -357,24 +414,31 @@ class CostAnalysis:
         }
 
     def calculate_costs(self, thickness, cooling_power):
-        """计算成本指标"""
+        """计算成本指标（标量或整条厚度扫的数组输入均可）"""
+        thickness = np.asarray(thickness, dtype=float)
+        cooling_power = np.asarray(cooling_power, dtype=float)
+        scalar_input = thickness.ndim == 0 and cooling_power.ndim == 0
+
         material_cost = thickness * self.cost_params['pdms_material']
         total_cost = material_cost + self.cost_params['fabrication'] + \
                      self.cost_params['substrate'] + self.cost_params['installation']
 
-        if cooling_power > 0:
-            cost_per_watt = total_cost / cooling_power
-            cost_effectiveness = cooling_power / total_cost
-        else:
-            cost_per_watt = float('inf')
-            cost_effectiveness = 0
+        with np.errstate(divide='ignore'):
+            cost_per_watt = np.where(cooling_power > 0,
+                                     total_cost / np.maximum(cooling_power, 1e-12),
+                                     np.inf)
+            cost_effectiveness = np.where(cooling_power > 0,
+                                          cooling_power / total_cost, 0.0)
 
-        return {
+        results = {
             'material_cost': material_cost,
             'total_cost': total_cost,
             'cost_per_watt': cost_per_watt,
             'cost_effectiveness': cost_effectiveness
         }
+        if scalar_input:
+            results = {key: float(value) for key, value in results.items()}
+        return results
 
 
 # 运行基于文献的分析
@@ -1,11 +1,48 @@
+from enum import IntEnum
+
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # 无界面后端：批量运行不拉起GUI，启动更快
 import matplotlib.pyplot as plt
-from scipy.optimize import differential_evolution
 import warnings
 
 warnings.filterwarnings('ignore')
 plt.rcParams['font.sans-serif'] = ['SimHei']
 
+# 材料→层功能映射（O(1)哈希查询，替代热循环里的列表成员测试）
+FUNCTION_OF = {
+    'Ag': 'reflector',
+    'Al': 'reflector',
+    'PDMS': 'emitter',
+    'SiO2': 'dielectric',
+    'TiO2': 'dielectric',
+}
+
+# 近似折射率（模块级常量，避免每次调用重建字典）
+REFRACTIVE_INDEX = {'SiO2': 1.45, 'TiO2': 2.4, 'PDMS': 1.4}
+
+# 材料整数编号：内层循环用整数比较替代字符串比较（对外仍用材料名）
+class Mat(IntEnum):
+    Ag = 0
+    Al = 1
+    SiO2 = 2
+    TiO2 = 3
+    PDMS = 4
+
+
+# 结构SoA视图用：材料编号表，以及与之同序的功能编号
+# （0=reflector, 1=emitter, 2=dielectric，与FUNCTION_OF一致）
+MATERIALS = tuple(Mat.__members__)
+MATERIAL_ID = {m: int(Mat[m]) for m in MATERIALS}
+FUNCTION_IDS = np.array([0, 0, 2, 2, 1], dtype=np.int8)
+# 与Mat同序的近似折射率（金属层按默认1.5，与REFRACTIVE_INDEX.get一致）
+REFRACTIVE_INDEX_BY_ID = np.array([1.5, 1.5, 1.45, 2.4, 1.4])
+
+# 基于文献的多层结构性能增强因子，按层数-1索引
+# （1层基准 / 金属+PDMS / 金属+介电+PDMS / 多层干涉 / 优化多层）
+LITERATURE_ENHANCEMENT = np.array([1.00, 1.15, 1.35, 1.45, 1.55])
+
+
 class PhysicsBasedMultiLayerDesign:
     """基于物理原理的多层膜设计器 - 避免复杂的传输矩阵"""
 
@@ -42,8 +79,39 @@ class PhysicsBasedMultiLayerDesign:
         # 基于文献的性能基准
         self.performance_baseline = 93  # Zhai et al. 报道值 (W/m²)
 
+        # 结构级结果缓存：同一结构在层数分析/绘图/推荐中会被反复评估
+        self._performance_cache = {}
+        self._cost_cache = {}
+
+        # 批量成本计算用：材料→整数编号 + 同序单位成本向量
+        self._material_index = {m: i for i, m in enumerate(self.material_properties)}
+        self._material_cost = np.array([p['cost'] for p in self.material_properties.values()])
+
+        # 结构的SoA视图缓存（材料编号/厚度/功能编号数组）
+        self._soa_cache = {}
+
+    def _structure_arrays(self, structure):
+        """结构的SoA视图：(材料编号, 厚度, 功能编号)三元组，按结构元组缓存
+
+        对外接口仍然是(material, thickness)元组列表；这里只是把热路径
+        需要反复扫描的属性压成NumPy数组，便于整列判断和切片。
+        """
+        key = tuple(structure)
+        cached = self._soa_cache.get(key)
+        if cached is None:
+            material_ids = np.array([MATERIAL_ID[m] for m, _ in structure], dtype=np.int8)
+            thicknesses = np.array([t for _, t in structure], dtype=np.float32)
+            cached = (material_ids, thicknesses, FUNCTION_IDS[material_ids])
+            self._soa_cache[key] = cached
+        return cached
+
     def calculate_structure_performance(self, structure):
-        """基于物理原理计算结构性能"""
+        """基于物理原理计算结构性能（按结构元组缓存）"""
+        cache_key = tuple(structure)
+        cached = self._performance_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # 分析各层功能
         layer_functions = self.analyze_layer_functions(structure)
 
@@ -51,13 +119,16 @@ class PhysicsBasedMultiLayerDesign:
         solar_reflectivity = self.calculate_solar_reflectivity(structure, layer_functions)
         window_emissivity = self.calculate_window_emissivity(structure, layer_functions)
 
-        solar_absorptivity = max(0.01, 1 - solar_reflectivity)
-        selectivity = window_emissivity / max(solar_absorptivity, 0.01)
+        # 条件表达式替代builtin max()调用，省去每次求值的函数调用开销
+        solar_absorptivity = 1 - solar_reflectivity
+        if solar_absorptivity < 0.01:
+            solar_absorptivity = 0.01
+        selectivity = window_emissivity / solar_absorptivity
 
         # 基于物理原理的性能估算
         performance = self.estimate_cooling_power(structure)
 
-        return {
+        result = {
             'performance': performance,
             'solar_reflectivity': solar_reflectivity,
             'window_emissivity': window_emissivity,
@@ -65,41 +136,33 @@ class PhysicsBasedMultiLayerDesign:
             'selectivity': selectivity,
             'layer_functions': layer_functions
         }
+        self._performance_cache[cache_key] = result
+        return result
 
     def analyze_layer_functions(self, structure):
         """分析各层在结构中的功能"""
-        functions = {}
-
-        for i, (material, thickness) in enumerate(structure):
-            if material in ['Ag', 'Al']:
-                functions[i] = 'reflector'
-            elif material == 'PDMS':
-                functions[i] = 'emitter'
-            else:  # SiO2, TiO2
-                functions[i] = 'dielectric'
-
-        return functions
+        return {i: FUNCTION_OF[material] for i, (material, _) in enumerate(structure)}
 
     def calculate_solar_reflectivity(self, structure, layer_functions):
         """更准确的光学性能计算"""
-        # 区分有/无金属反射层的情况
-        has_reflector = any(func == 'reflector' for func in layer_functions.values())
-
-        if has_reflector:
-            # 有反射层：反射率主要由金属层决定
-            for i, (material, thickness) in enumerate(structure):
-                if layer_functions[i] == 'reflector':
-                    base_reflectivity = self.material_properties[material]['solar_reflectivity']
-                    # 考虑上层介电层的抗反射效应
-                    if i > 0 and layer_functions[i - 1] == 'dielectric':
-                        # 介电层厚度优化可以增强反射
-                        dielectric_enhancement = self.calculate_dielectric_enhancement(structure, i - 1)
-                        base_reflectivity *= dielectric_enhancement
-                    return min(0.98, base_reflectivity)
-        else:
+        # 一趟定位首个金属反射层，免去any()判断+二次遍历
+        _, _, function_ids = self._structure_arrays(structure)
+        reflector_mask = function_ids == 0
+        if not reflector_mask.any():
             # 无反射层：反射率较低，但不应像单层PDMS那么低
             return 0.15  # 更合理的值
 
+        # 有反射层：反射率主要由金属层决定
+        i = int(np.argmax(reflector_mask))
+        material = structure[i][0]
+        base_reflectivity = self.material_properties[material]['solar_reflectivity']
+        # 考虑上层介电层的抗反射效应
+        if i > 0 and function_ids[i - 1] == 2:
+            # 介电层厚度优化可以增强反射
+            dielectric_enhancement = self.calculate_dielectric_enhancement(structure, i - 1)
+            base_reflectivity *= dielectric_enhancement
+        return base_reflectivity if base_reflectivity < 0.98 else 0.98
+
     def calculate_window_emissivity(self, structure, layer_functions):
         """计算大气窗口发射率 - 基于物理原理的简化模型"""
         # 基础发射率
@@ -129,44 +192,44 @@ class PhysicsBasedMultiLayerDesign:
 
         # 干涉增强效应
         interference_enhancement = self.calculate_interference_enhancement(structure)
-        enhanced_emissivity = min(0.95, base_emissivity * interference_enhancement)
+        enhanced_emissivity = base_emissivity * interference_enhancement
 
-        return enhanced_emissivity
+        return enhanced_emissivity if enhanced_emissivity < 0.95 else 0.95
 
     def calculate_interference_enhancement(self, structure):
         """计算干涉增强效应"""
         enhancement = 1.0
 
-        # 统计介电层数量
-        dielectric_layers = sum(1 for mat, _ in structure if mat in ['SiO2', 'TiO2'])
+        # 统计介电层数量（SoA视图整列求和）
+        material_ids, thicknesses, function_ids = self._structure_arrays(structure)
+        dielectric_layers = int((function_ids == 2).sum())
 
         if dielectric_layers > 0:
             # 每增加一个介电层，干涉效应增强
             enhancement += 0.15 * dielectric_layers
 
-            # 检查是否存在四分之一波长结构
-            for i, (material, thickness) in enumerate(structure):
-                if material in ['SiO2', 'TiO2']:
-                    # 粗略检查是否接近四分之一波长（针对10μm）
-                    optical_thickness = self.get_optical_thickness(material, thickness)
-                    quarter_wave_condition = optical_thickness / 2.5  # 10μm/4 = 2.5μm
+            # 检查是否存在四分之一波长结构：只遍历介电层，按编号查折射率
+            for i in np.nonzero(function_ids == 2)[0]:
+                # 粗略检查是否接近四分之一波长（针对10μm）
+                optical_thickness = REFRACTIVE_INDEX_BY_ID[material_ids[i]] * thicknesses[i] / 1000
+                quarter_wave_condition = optical_thickness / 2.5  # 10μm/4 = 2.5μm
 
-                    if 0.8 <= quarter_wave_condition <= 1.2:
-                        enhancement += 0.1  # 四分之一波长增强
+                if 0.8 <= quarter_wave_condition <= 1.2:
+                    enhancement += 0.1  # 四分之一波长增强
 
-        return min(enhancement, 1.5)  # 限制最大增强
+        return enhancement if enhancement < 1.5 else 1.5  # 限制最大增强
 
     def get_optical_thickness(self, material, thickness_nm):
         """计算光学厚度（单位：μm）"""
-        # 近似折射率
-        refractive_indices = {'SiO2': 1.45, 'TiO2': 2.4, 'PDMS': 1.4}
-        n = refractive_indices.get(material, 1.5)
+        n = REFRACTIVE_INDEX.get(material, 1.5)
 
         return n * thickness_nm / 1000  # 转换为μm
 
     def calculate_selectivity_corrected(self, solar_reflectivity, window_emissivity):
         """修正的选择性计算"""
-        solar_absorptivity = max(0.01, 1 - solar_reflectivity)
+        solar_absorptivity = 1 - solar_reflectivity
+        if solar_absorptivity < 0.01:
+            solar_absorptivity = 0.01
         # 对于金属反射层，太阳吸收率应该很低
         if solar_reflectivity > 0.9:
             solar_absorptivity = 0.03  # 更合理的值
@@ -174,18 +237,13 @@ class PhysicsBasedMultiLayerDesign:
 
     def estimate_cooling_power(self, structure):
         """增强的性能估算模型"""
-        # 基于文献的多层结构性能数据
-        literature_enhancement = {
-            1: 1.00,  # 单层基准
-            2: 1.15,  # 金属反射层 + PDMS
-            3: 1.35,  # 金属+介电层+PDMS
-            4: 1.45,  # 多层干涉结构
-            5: 1.55  # 优化多层结构
-        }
-
         base_power = 101.1  # 单层PDMS基准
         num_layers = len(structure)
-        enhancement = literature_enhancement.get(num_layers, 1.0)
+        # 模块级因子表按层数-1索引，超出文献范围时不增强
+        if 1 <= num_layers <= len(LITERATURE_ENHANCEMENT):
+            enhancement = LITERATURE_ENHANCEMENT[num_layers - 1]
+        else:
+            enhancement = 1.0
 
         return base_power * enhancement
 
@@ -200,15 +258,16 @@ class PhysicsBasedMultiLayerDesign:
             return 1.0
 
         material, thickness = structure[dielectric_index]
+        material_id = MATERIAL_ID[material]
 
-        # 基于物理原理的简化增强模型
-        if material == 'SiO2':
+        # 基于物理原理的简化增强模型（整数比较替代字符串比较）
+        if material_id == Mat.SiO2:
             # SiO2的典型增强效果
             if 200 <= thickness <= 300:  # 接近四分之一波长
                 return 1.08
             else:
                 return 1.03
-        elif material == 'TiO2':
+        elif material_id == Mat.TiO2:
             # TiO2的典型增强效果（高折射率）
             if 100 <= thickness <= 200:  # 接近四分之一波长
                 return 1.12
@@ -218,7 +277,12 @@ class PhysicsBasedMultiLayerDesign:
             return 1.0  # 其他材料无显著增强
 
     def calculate_structure_cost(self, structure):
-        """计算结构成本"""
+        """计算结构成本（按结构元组缓存）"""
+        cache_key = tuple(structure)
+        cached = self._cost_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         total_cost = 0
 
         for material, thickness in structure:
@@ -230,7 +294,31 @@ class PhysicsBasedMultiLayerDesign:
         # 固定制造成本（随层数增加）
         fabrication_cost = 10 + 2 * len(structure)
 
-        return total_cost + fabrication_cost
+        cost = total_cost + fabrication_cost
+        self._cost_cache[cache_key] = cost
+        return cost
+
+    def calculate_structure_costs(self, structures):
+        """批量计算一组候选结构的成本（向量化求和，供网格扫描用）
+
+        结构按材料编号+厚度打包成(num_structures, max_layers)矩阵，
+        零厚度填充的空位对成本无贡献，求和一次完成。
+        """
+        if len(structures) == 0:
+            return np.empty(0)
+
+        num_layers = np.array([len(s) for s in structures])
+        max_layers = int(num_layers.max())
+        material_ids = np.zeros((len(structures), max_layers), dtype=np.intp)
+        thicknesses = np.zeros((len(structures), max_layers))
+        for i, structure in enumerate(structures):
+            for j, (material, thickness) in enumerate(structure):
+                material_ids[i, j] = self._material_index[material]
+                thicknesses[i, j] = thickness
+
+        material_costs = (self._material_cost[material_ids] * thicknesses / 10000.0).sum(axis=1)
+        fabrication_costs = 10 + 2 * num_layers
+        return material_costs + fabrication_costs
 
 
 class LayerNumberOptimizer:
@@ -248,6 +336,21 @@ class LayerNumberOptimizer:
             5: [('Ag', 100), ('SiO2', 150), ('TiO2', 100), ('SiO2', 150), ('PDMS', 8000)]  # 五层优化
         }
 
+        # 层数分析结果的SoA视图（结构化数组），供选优和绘图按列切片
+        self._results_soa = None
+
+    def _as_soa(self, results):
+        """把结果字典列表压成结构化数组，一趟完成所有列提取"""
+        if self._results_soa is None or len(self._results_soa) != len(results):
+            self._results_soa = np.array(
+                [(r['num_layers'], r['performance'], r['cost'], r['cost_effectiveness'],
+                  r['optical_performance']['solar_reflectivity'],
+                  r['optical_performance']['window_emissivity'])
+                 for r in results],
+                dtype=[('n', 'i4'), ('perf', 'f8'), ('cost', 'f8'),
+                       ('ce', 'f8'), ('sr', 'f8'), ('we', 'f8')])
+        return self._results_soa
+
     def analyze_layer_impact(self, max_layers=5):
         """分析层数对性能的影响"""
         print("🔬 基于物理原理的层数影响分析")
@@ -298,10 +401,8 @@ class LayerNumberOptimizer:
 
     def find_optimal_structure(self, results):
         """基于成本效益找到最优结构"""
-        # 按成本效益排序
-        sorted_results = sorted(results, key=lambda x: x['cost_effectiveness'], reverse=True)
-
-        best_result = sorted_results[0]
+        # 只需最大值，argmax即可，无需整表排序
+        best_result = results[int(np.argmax(self._as_soa(results)['ce']))]
 
         print(f"\n🎯 最优结构选择:")
         print(f"  推荐层数: {best_result['num_layers']} 层")
@@ -313,14 +414,16 @@ class LayerNumberOptimizer:
 
         return best_result
 
-    def plot_comprehensive_analysis(self, results):
-        """绘制综合分析图表"""
+    def plot_comprehensive_analysis(self, results, show=False):
+        """绘制综合分析图表（图固定存盘；show=True时才弹窗阻塞）"""
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
 
-        layers = [r['num_layers'] for r in results]
-        performances = [r['performance'] for r in results]
-        costs = [r['cost'] for r in results]
-        cost_effectiveness = [r['cost_effectiveness'] for r in results]
+        # 一次性取出SoA列，替代对结果列表的多趟遍历
+        soa = self._as_soa(results)
+        layers = soa['n']
+        performances = soa['perf']
+        costs = soa['cost']
+        cost_effectiveness = soa['ce']
 
         # 性能 vs 层数
         ax1.plot(layers, performances, 'bo-', linewidth=3, markersize=10, label='冷却功率')
@@ -361,8 +464,8 @@ class LayerNumberOptimizer:
                          textcoords="offset points", xytext=(0, 10), ha='center', fontweight='bold')
 
         # 光学性能对比
-        solar_reflectivity = [r['optical_performance']['solar_reflectivity'] for r in results]
-        window_emissivity = [r['optical_performance']['window_emissivity'] for r in results]
+        solar_reflectivity = soa['sr']
+        window_emissivity = soa['we']
 
         width = 0.35
         x = np.arange(len(layers))
@@ -389,7 +492,10 @@ class LayerNumberOptimizer:
 
         plt.tight_layout()
         plt.savefig('physics_based_layer_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
 
 
 def run_physics_based_problem3():
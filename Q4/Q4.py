@@ -1,3 +1,7 @@
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -5,38 +9,47 @@ from Q1.Q1  import LiteratureCalibratedPDMSModel
 from Q2.Q2 import LiteratureBasedRadiativeCoolingEvaluator, CostAnalysis
 from Q3.Q3_base_reality import PhysicsBasedMultiLayerDesign, LayerNumberOptimizer
 
+# 热路径诊断走logging：默认WARNING级别下debug调用在C层直接短路
+log = logging.getLogger(__name__)
 
-class EnhancedCostAnalysis(CostAnalysis):
-    def calculate_multilayer_costs(self, structure, cooling_power):
-        """修正的多层结构成本计算 - 使用合理的成本参数"""
-        # 修正：使用更实际的材料单位成本（美元/微米/m²）
-        material_unit_costs = {
-            'Ag': 8.0,  # 银：8美元/微米/m² (实际：5-15美元)
-            'Al': 2.5,  # 铝：2.5美元/微米/m² (实际：2-5美元)
-            'SiO2': 1.2,  # 二氧化硅：1.2美元/微米/m² (实际：1-3美元)
-            'TiO2': 3.0,  # 二氧化钛：3美元/微米/m² (实际：2-6美元)
-            'PDMS': 0.8  # PDMS：0.8美元/微米/m² (实际：0.5-2美元)
-        }
-
-        material_cost = 0
-        layer_costs = []
 
-        print(f"🔍 详细成本计算 - 结构: {structure}")
+@dataclass(slots=True, frozen=True)
+class LayerCost:
+    """单层成本记录：槽位属性访问替代字典哈希查键，且不可变"""
+    material: str
+    thickness: float
+    cost: float
 
-        for material, thickness_nm in structure:
-            thickness_um = thickness_nm / 1000  # 纳米转微米
-            unit_cost = material_unit_costs.get(material, 1.0)
-            layer_cost = unit_cost * thickness_um
 
-            print(
-                f"   {material}: {thickness_nm}nm = {thickness_um}μm, 单位成本${unit_cost}/μm, 层成本${layer_cost:.2f}")
+class EnhancedCostAnalysis(CostAnalysis):
+    # 修正：使用更实际的材料单位成本（美元/微米/m²），类级常量只建一次
+    _UNIT_COSTS = {
+        'Ag': 8.0,  # 银：8美元/微米/m² (实际：5-15美元)
+        'Al': 2.5,  # 铝：2.5美元/微米/m² (实际：2-5美元)
+        'SiO2': 1.2,  # 二氧化硅：1.2美元/微米/m² (实际：1-3美元)
+        'TiO2': 3.0,  # 二氧化钛：3美元/微米/m² (实际：2-6美元)
+        'PDMS': 0.8  # PDMS：0.8美元/微米/m² (实际：0.5-2美元)
+    }
 
-            material_cost += layer_cost
-            layer_costs.append({
-                'material': material,
-                'thickness': thickness_nm,
-                'cost': round(layer_cost, 2)
-            })
+    def calculate_multilayer_costs(self, structure, cooling_power):
+        """修正的多层结构成本计算 - 材料成本走一次点积，明细只在DEBUG级输出"""
+        materials, thicknesses_nm = zip(*structure)
+        thicknesses_um = np.asarray(thicknesses_nm, dtype=np.float64) / 1000.0  # 纳米转微米
+        unit_costs = np.fromiter((self._UNIT_COSTS.get(m, 1.0) for m in materials),
+                                 dtype=np.float64, count=len(materials))
+        per_layer_costs = unit_costs * thicknesses_um
+        material_cost = float(per_layer_costs.sum())
+
+        layer_costs = [LayerCost(material, thickness_nm, round(float(layer_cost), 2))
+                       for material, thickness_nm, layer_cost
+                       in zip(materials, thicknesses_nm, per_layer_costs)]
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("🔍 详细成本计算 - 结构: %s", structure)
+            for material, thickness_nm, unit_cost, layer_cost in zip(
+                    materials, thicknesses_nm, unit_costs, per_layer_costs):
+                log.debug("   %s: %snm = %sμm, 单位成本$%s/μm, 层成本$%.2f",
+                          material, thickness_nm, thickness_nm / 1000, unit_cost, layer_cost)
 
         # 修正制造复杂度成本
         base_fabrication = 15.0  # 基础制造费用
@@ -56,12 +69,13 @@ class EnhancedCostAnalysis(CostAnalysis):
             cost_per_watt = float('inf')
             cost_effectiveness = 0
 
-        print(f"📊 成本汇总:")
-        print(f"   材料成本: ${material_cost:.2f}")
-        print(f"   制造费用: ${fabrication_cost:.2f}")
-        print(f"   衬底成本: ${substrate_cost:.2f}")
-        print(f"   安装成本: ${installation_cost:.2f}")
-        print(f"   总成本: ${total_cost:.2f}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("📊 成本汇总:")
+            log.debug("   材料成本: $%.2f", material_cost)
+            log.debug("   制造费用: $%.2f", fabrication_cost)
+            log.debug("   衬底成本: $%.2f", substrate_cost)
+            log.debug("   安装成本: $%.2f", installation_cost)
+            log.debug("   总成本: $%.2f", total_cost)
 
         return {
             'total_cost': round(total_cost, 2),
@@ -82,7 +96,6 @@ class ComprehensiveRadiativeCoolingOptimizer:
         self.pdms_model = LiteratureCalibratedPDMSModel(substrate_type='silicon')
         self.evaluator = LiteratureBasedRadiativeCoolingEvaluator(self.pdms_model)
         self.multilayer_designer = PhysicsBasedMultiLayerDesign()
-        self.cost_analyzer = CostAnalysis()
         self.enhanced_cost_analyzer = EnhancedCostAnalysis()
 
         # 最优设计配置（基于前三个问题的结果）- 修正结构定义
@@ -104,18 +117,41 @@ class ComprehensiveRadiativeCoolingOptimizer:
             }
         }
 
-        # 验证设计配置
+        # 验证设计配置，并一次性提取各设计的PDMS层厚度（μm，缺省11.0）
         for design_key, design in self.optimal_designs.items():
+            design['pdms_thickness_um'] = next(
+                (thickness / 1000 for material, thickness in design['structure']
+                 if material == 'PDMS'), 11.0)
             print(f"✅ 设计验证: {design['description']} - {len(design['structure'])}层")
 
+        # 评估结果缓存：对比/推荐/报告阶段会反复评估同一设计
+        self._eval_cache = {}
+
+        # 描述→design_key反查表（O(1)，替代对optimal_designs的线性扫描）
+        self._desc_to_key = {d['description']: k for k, d in self.optimal_designs.items()}
+
+        # 光学性能备忘录：同一结构（元组键）整个程序周期只解一次
+        self._optical_perf_cache = {}
+
+    def _optical_perf(self, structure):
+        """结构光学性能的元组键备忘录包装"""
+        key = tuple(structure)
+        cached = self._optical_perf_cache.get(key)
+        if cached is None:
+            cached = self.multilayer_designer.calculate_structure_performance(structure)
+            self._optical_perf_cache[key] = cached
+        return cached
+
     def comprehensive_performance_evaluation(self, design_key):
-        """修正的综合性能评估"""
+        """修正的综合性能评估（按design_key缓存，重复调用直接命中）"""
+        cached = self._eval_cache.get(design_key)
+        if cached is not None:
+            return cached
+
         design = self.optimal_designs[design_key]
 
-        # 光学性能分析
-        optical_performance = self.multilayer_designer.calculate_structure_performance(
-            design['structure']
-        )
+        # 光学性能分析（结构级备忘录，重复结构不再重解）
+        optical_performance = self._optical_perf(design['structure'])
 
         # 修正的成本分析 - 使用多层结构成本计算
         cost_data = self.enhanced_cost_analyzer.calculate_multilayer_costs(
@@ -123,26 +159,15 @@ class ComprehensiveRadiativeCoolingOptimizer:
             design['performance']
         )
 
-        # 环境适应性分析
-        environment_performances = []
-        for env_name, env_profile in self.evaluator.environment_profiles.items():
-            pdms_thickness = None
-            for material, thickness in design['structure']:
-                if material == 'PDMS':
-                    pdms_thickness = thickness / 1000  # 转换为μm
-                    break
-
-            if pdms_thickness is None:
-                pdms_thickness = 11.0
-
-            env_perf = self.evaluator.calculate_net_cooling_literature_based(
-                pdms_thickness, env_profile
-            )
+        # 环境适应性分析：全部环境一次批量评估（PDMS厚度已在__init__提取）
+        environment_performances = self.evaluator.calculate_net_cooling_batch(
+            design['pdms_thickness_um'])
+        for (env_name, env_profile), env_perf in zip(
+                self.evaluator.environment_profiles.items(), environment_performances):
             env_perf['environment'] = env_name
             env_perf['location'] = env_profile['location']
-            environment_performances.append(env_perf)
 
-        return {
+        evaluation = {
             'design_info': design,
             'optical_performance': optical_performance,
             'environment_performances': environment_performances,
@@ -150,6 +175,8 @@ class ComprehensiveRadiativeCoolingOptimizer:
             'technical_feasibility': self.assess_technical_feasibility(design),
             'manufacturing_feasibility': self.assess_manufacturing_feasibility(design)
         }
+        self._eval_cache[design_key] = evaluation
+        return evaluation
 
     def assess_technical_feasibility(self, design):
         """技术可行性评估"""
@@ -177,6 +204,15 @@ class ComprehensiveRadiativeCoolingOptimizer:
 
         return feasibility
 
+    # 材料→(沉积工艺, 所需设备)调度表：O(1)查表替代逐层if/elif链
+    _PROCESS_MAP = {
+        'Ag': ('磁控溅射', '磁控溅射设备'),
+        'Al': ('磁控溅射', '磁控溅射设备'),
+        'SiO2': ('PECVD', 'PECVD设备'),
+        'TiO2': ('原子层沉积', '原子层沉积设备'),
+        'PDMS': ('旋涂+固化', '旋涂机+热板'),
+    }
+
     def assess_manufacturing_feasibility(self, design):
         """修正的制造可行性评估 - 确保处理所有层"""
         manufacturing = {
@@ -187,28 +223,19 @@ class ComprehensiveRadiativeCoolingOptimizer:
             'quality_control': '标准光学检测方法'
         }
 
-        print(f"🔧 调试: 处理设计结构，层数={len(design['structure'])}")
+        log.debug("🔧 调试: 处理设计结构，层数=%d", len(design['structure']))
+
+        # 设备去重用set旁查（列表in是O(n)，层多时退化为O(n²)）
+        seen_equipment = set()
 
         # 确保正确处理所有层
         for i, (material, thickness) in enumerate(design['structure']):
-            if material in ['Ag', 'Al']:
-                process = f'第{i + 1}层: {material} - 磁控溅射 ({thickness}nm)'
-                equipment = '磁控溅射设备'
-            elif material in ['SiO2']:
-                process = f'第{i + 1}层: {material} - PECVD ({thickness}nm)'
-                equipment = 'PECVD设备'
-            elif material in ['TiO2']:
-                process = f'第{i + 1}层: {material} - 原子层沉积 ({thickness}nm)'
-                equipment = '原子层沉积设备'
-            elif material == 'PDMS':
-                process = f'第{i + 1}层: PDMS - 旋涂+固化 ({thickness}nm)'
-                equipment = '旋涂机+热板'
-            else:
-                process = f'第{i + 1}层: {material} - 标准沉积 ({thickness}nm)'
-                equipment = '通用沉积设备'
+            process_name, equipment = self._PROCESS_MAP.get(material, ('标准沉积', '通用沉积设备'))
+            process = f'第{i + 1}层: {material} - {process_name} ({thickness}nm)'
 
             manufacturing['process_flow'].append(process)
-            if equipment not in manufacturing['equipment_requirements']:
+            if equipment not in seen_equipment:
+                seen_equipment.add(equipment)
                 manufacturing['equipment_requirements'].append(equipment)
 
         # 根据层数调整良率估计
@@ -244,104 +271,134 @@ class ComprehensiveRadiativeCoolingOptimizer:
             'total_operating_cost_per_m2': cost_data['total_cost']
         }
 
-        # 收益分析 - 修正：使用正确的冷却功率
-        cooling_power = design['performance']
-        daily_operation_hours = 10
-        electricity_price = 0.15  # 美元/kWh
-        annual_operation_days = 365
-
-        daily_energy_saving = cooling_power * daily_operation_hours / 1000  # kWh/天
-        annual_energy_saving = daily_energy_saving * annual_operation_days  # kWh/年
-        annual_cost_saving = annual_energy_saving * electricity_price  # 美元/年
-
-        # 投资回报分析
-        production_capacity = 10000  # m²/年
-        annual_revenue = annual_cost_saving * production_capacity
-        annual_operating_cost = operating_costs['total_operating_cost_per_m2'] * production_capacity
-        annual_profit = annual_revenue - annual_operating_cost
-
-        payback_period = capital_investment['total_investment'] / annual_profit if annual_profit > 0 else float('inf')
+        # 收益与投资指标：复用批量版，标量只是长度为1的批
+        metrics = self.economic_analysis_batch(
+            np.array([design['performance']]),
+            np.array([operating_costs['total_operating_cost_per_m2']]))
 
         return {
             'capital_investment': capital_investment,
             'operating_costs': operating_costs,
             'revenue_analysis': {
-                'daily_energy_saving_per_m2': daily_energy_saving,
-                'annual_energy_saving_per_m2': annual_energy_saving,
-                'annual_cost_saving_per_m2': annual_cost_saving,
-                'production_capacity': production_capacity,
-                'annual_revenue': annual_revenue,
-                'annual_operating_cost': annual_operating_cost,
-                'annual_profit': annual_profit
+                'daily_energy_saving_per_m2': float(metrics['daily_energy_saving_per_m2'][0]),
+                'annual_energy_saving_per_m2': float(metrics['annual_energy_saving_per_m2'][0]),
+                'annual_cost_saving_per_m2': float(metrics['annual_cost_saving_per_m2'][0]),
+                'production_capacity': self.PRODUCTION_CAPACITY,
+                'annual_revenue': float(metrics['annual_revenue'][0]),
+                'annual_operating_cost': float(metrics['annual_operating_cost'][0]),
+                'annual_profit': float(metrics['annual_profit'][0])
             },
             'investment_metrics': {
-                'payback_period': payback_period,
-                'roi_first_year': annual_profit / capital_investment['total_investment'] * 100 if capital_investment['total_investment'] > 0 else 0,
-                'npv_5years': self.calculate_npv(annual_profit, 5, 0.1) - capital_investment['total_investment']
+                'payback_period': float(metrics['payback_period'][0]),
+                'roi_first_year': float(metrics['roi_first_year'][0]),
+                'npv_5years': float(metrics['npv_5years'][0])
             }
         }
 
+    # 经济分析的固定参数
+    TOTAL_INVESTMENT = 800000  # 美元
+    PRODUCTION_CAPACITY = 10000  # m²/年
+    DAILY_OPERATION_HOURS = 10
+    ELECTRICITY_PRICE = 0.15  # 美元/kWh
+    ANNUAL_OPERATION_DAYS = 365
+
+    def economic_analysis_batch(self, cooling_powers, total_costs_per_m2):
+        """整批设计的经济指标（SoA广播）
+
+        冷却功率与单位成本各给一个向量，全部收益/回收期/ROI/净现值
+        一次广播算完，返回按列组织的数组字典；对比环节借此免去
+        逐设计的标量经济分析。
+        """
+        cooling_powers = np.asarray(cooling_powers, dtype=float)
+        total_costs_per_m2 = np.asarray(total_costs_per_m2, dtype=float)
+
+        daily_energy_saving = cooling_powers * self.DAILY_OPERATION_HOURS / 1000  # kWh/天
+        annual_energy_saving = daily_energy_saving * self.ANNUAL_OPERATION_DAYS  # kWh/年
+        annual_cost_saving = annual_energy_saving * self.ELECTRICITY_PRICE  # 美元/年
+
+        annual_revenue = annual_cost_saving * self.PRODUCTION_CAPACITY
+        annual_operating_cost = total_costs_per_m2 * self.PRODUCTION_CAPACITY
+        annual_profit = annual_revenue - annual_operating_cost
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            payback_period = np.where(annual_profit > 0,
+                                      self.TOTAL_INVESTMENT / annual_profit,
+                                      np.inf)
+        roi_first_year = annual_profit / self.TOTAL_INVESTMENT * 100
+        npv_5years = self.calculate_npv(annual_profit, 5, 0.1) - self.TOTAL_INVESTMENT
+
+        return {
+            'daily_energy_saving_per_m2': daily_energy_saving,
+            'annual_energy_saving_per_m2': annual_energy_saving,
+            'annual_cost_saving_per_m2': annual_cost_saving,
+            'annual_revenue': annual_revenue,
+            'annual_operating_cost': annual_operating_cost,
+            'annual_profit': annual_profit,
+            'payback_period': payback_period,
+            'roi_first_year': roi_first_year,
+            'npv_5years': npv_5years
+        }
+
     def calculate_npv(self, annual_cashflow, years, discount_rate):
-        """计算净现值"""
-        npv = 0
-        for year in range(1, years + 1):
-            npv += annual_cashflow / ((1 + discount_rate) ** year)
-        return npv
-
-    def compare_designs(self):
-        """设计方案综合对比"""
+        """计算净现值（等额现金流年金闭式解，标量/数组皆可）"""
+        return annual_cashflow * (1 - (1 + discount_rate) ** -years) / discount_rate
+
+    def compare_designs(self, evaluations=None):
+        """设计方案综合对比
+
+        evaluations给定时直接复用外部已算好的评估结果；否则走
+        comprehensive_performance_evaluation（有缓存，不会重复评估）。
+        """
         comparisons = []
 
         for design_key in self.optimal_designs.keys():
-            evaluation = self.comprehensive_performance_evaluation(design_key)
-            economic_data = self.economic_analysis(evaluation)
+            if evaluations is not None and design_key in evaluations:
+                evaluation = evaluations[design_key]
+            else:
+                evaluation = self.comprehensive_performance_evaluation(design_key)
 
             comparison = {
+                'design_key': design_key,
                 'design_name': self.optimal_designs[design_key]['description'],
                 'performance': self.optimal_designs[design_key]['performance'],
                 'cost_per_m2': evaluation['cost_data']['total_cost'],
                 'cost_effectiveness': evaluation['cost_data']['cost_effectiveness'],
                 'technical_feasibility': evaluation['technical_feasibility']['material_availability'],
-                'payback_period': economic_data['investment_metrics']['payback_period'],
                 'optical_performance': evaluation['optical_performance']
             }
             comparisons.append(comparison)
 
+        # 投资回收期：全部设计一次批量经济分析
+        metrics = self.economic_analysis_batch(
+            np.array([comp['performance'] for comp in comparisons]),
+            np.array([comp['cost_per_m2'] for comp in comparisons]))
+        for comp, payback in zip(comparisons, metrics['payback_period']):
+            comp['payback_period'] = float(payback)
+
         return comparisons
 
-    def generate_final_recommendation(self):
+    def generate_final_recommendation(self, evaluations=None):
         """生成最终推荐方案 - 调整权重更重视经济性"""
-        comparisons = self.compare_designs()
-
-        # 多目标决策：调整权重，更重视经济性
-        for comp in comparisons:
-            # 性能评分 (0-1)
-            perf_score = comp['performance'] / 150.0
-
-            # 成本效益评分 - 更重视
-            cost_eff_score = min(comp['cost_effectiveness'] / 3.0, 1.0)
-
-            # 可行性评分
-            feasibility_score = 1.0 if comp['technical_feasibility'] == '高' else 0.7
-
-            # 投资回收期评分 - 更重视
-            if comp['payback_period'] <= 3:
-                payback_score = 1.0
-            elif comp['payback_period'] <= 5:
-                payback_score = 0.7
-            else:
-                payback_score = 0.3
-
-            # 调整权重：经济性权重增加
-            comp['comprehensive_score'] = (
-                    perf_score * 0.25 +
-                    cost_eff_score * 0.35 +
-                    feasibility_score * 0.2 +
-                    payback_score * 0.2
-            )
+        comparisons = self.compare_designs(evaluations)
+
+        # 多目标决策：四项子分整批广播算完（回收期分档用np.select免分支）
+        perf_score = np.array([c['performance'] for c in comparisons]) / 150.0
+        cost_eff_score = np.minimum(
+            np.array([c['cost_effectiveness'] for c in comparisons]) / 3.0, 1.0)
+        feasibility_score = np.where(
+            np.array([c['technical_feasibility'] == '高' for c in comparisons]), 1.0, 0.7)
+        payback = np.array([c['payback_period'] for c in comparisons])
+        payback_score = np.select([payback <= 3, payback <= 5], [1.0, 0.7], default=0.3)
+
+        # 调整权重：经济性权重增加
+        weights = np.array([0.25, 0.35, 0.2, 0.2])
+        scores = np.stack([perf_score, cost_eff_score, feasibility_score, payback_score],
+                          axis=1) @ weights
+        for comp, score in zip(comparisons, scores):
+            comp['comprehensive_score'] = float(score)
 
         # 选择最优方案
-        best_design = max(comparisons, key=lambda x: x['comprehensive_score'])
+        best_design = comparisons[int(np.argmax(scores))]
 
         # 验证选择合理性
         print(f"🔍 方案选择验证:")
@@ -363,10 +420,10 @@ def run_problem4_comprehensive_solution():
 
     print("\n🔬 开始综合性能评估...")
 
-    # 评估各设计方案
+    # 评估各设计方案（输出先攒行，每个设计一次print）
     design_evaluations = {}
     for design_key in optimizer.optimal_designs.keys():
-        print(f"\n📊 评估设计方案: {optimizer.optimal_designs[design_key]['description']}")
+        lines = [f"\n📊 评估设计方案: {optimizer.optimal_designs[design_key]['description']}"]
         evaluation = optimizer.comprehensive_performance_evaluation(design_key)
         design_evaluations[design_key] = evaluation
 
@@ -375,76 +432,73 @@ def run_problem4_comprehensive_solution():
         process_steps = len(evaluation['manufacturing_feasibility']['process_flow'])
 
         if design_layers == process_steps:
-            print(f"   ✅ 结构一致性验证通过: {design_layers}层设计 = {process_steps}步工艺")
+            lines.append(f"   ✅ 结构一致性验证通过: {design_layers}层设计 = {process_steps}步工艺")
         else:
-            print(f"   ⚠️ 结构不一致: {design_layers}层设计 vs {process_steps}步工艺")
+            lines.append(f"   ⚠️ 结构不一致: {design_layers}层设计 vs {process_steps}步工艺")
 
         # 输出关键指标
-        print(f"  冷却功率: {evaluation['design_info']['performance']:.1f} W/m²")
-        print(f"  太阳反射率: {evaluation['optical_performance']['solar_reflectivity']:.3f}")
-        print(f"  窗口发射率: {evaluation['optical_performance']['window_emissivity']:.3f}")
-        print(f"  成本: ${evaluation['cost_data']['total_cost']:.2f}/m²")
+        lines.append(f"  冷却功率: {evaluation['design_info']['performance']:.1f} W/m²")
+        lines.append(f"  太阳反射率: {evaluation['optical_performance']['solar_reflectivity']:.3f}")
+        lines.append(f"  窗口发射率: {evaluation['optical_performance']['window_emissivity']:.3f}")
+        lines.append(f"  成本: ${evaluation['cost_data']['total_cost']:.2f}/m²")
+        print("\n".join(lines))
 
     print("\n⚖️ 进行方案综合对比...")
-    comparisons = optimizer.compare_designs()
+    comparisons = optimizer.compare_designs(design_evaluations)
 
     print("\n🎯 生成最终推荐方案...")
-    best_design, all_comparisons = optimizer.generate_final_recommendation()
+    best_design, all_comparisons = optimizer.generate_final_recommendation(design_evaluations)
 
-    # 输出最终推荐
-    print("\n" + "=" * 80)
-    print("🏆 最终推荐方案")
-    print("=" * 80)
-    print(f"推荐设计: {best_design['design_name']}")
-    print(f"综合评分: {best_design['comprehensive_score']:.3f}")
-    print(f"冷却功率: {best_design['performance']:.1f} W/m²")
-    print(f"成本效益: {best_design['cost_effectiveness']:.2f} W/$")
-    print(f"投资回收期: {best_design['payback_period']:.2f} 年")
-
-    # 修正：使用正确的设计评估
-    best_design_key = None
-    for key, design in optimizer.optimal_designs.items():
-        if design['description'] == best_design['design_name']:
-            best_design_key = key
-            break
-
-    if best_design_key is None:
-        best_design_key = 'multilayer_optimal'  # 默认使用三层设计
-
-    best_evaluation = design_evaluations[best_design_key]
+    # 修正：对比结果自带design_key，直接取对应评估
+    best_evaluation = design_evaluations[best_design['design_key']]
     economic_analysis = optimizer.economic_analysis(best_evaluation)
 
-    print(f"\n💰 详细经济性分析:")
-    print(f"  总投资: ${economic_analysis['capital_investment']['total_investment']:,.0f}")
-    print(f"  年利润: ${economic_analysis['revenue_analysis']['annual_profit']:,.0f}")
-    print(f"  投资回收期: {economic_analysis['investment_metrics']['payback_period']:.2f} 年")
-    print(f"  第一年ROI: {economic_analysis['investment_metrics']['roi_first_year']:.1f}%")
-    print(f"  5年净现值: ${economic_analysis['investment_metrics']['npv_5years']:,.0f}")
-
-    print(f"\n🔧 技术可行性:")
     tech_feasibility = best_evaluation['technical_feasibility']
-    print(f"  材料可获得性: {tech_feasibility['material_availability']}")
-    print(f"  工艺成熟度: {tech_feasibility['process_maturity']}")
-    print(f"  规模化能力: {tech_feasibility['scalability']}")
-    print(f"  预期寿命: {tech_feasibility['lifespan']}")
+    manufacturing = best_evaluation['manufacturing_feasibility']
 
-    if tech_feasibility['technical_risks']:
-        print(f"  技术风险: {', '.join(tech_feasibility['technical_risks'])}")
+    # 最终汇总攒成一个缓冲区，一次性输出
+    lines = [
+        "\n" + "=" * 80,
+        "🏆 最终推荐方案",
+        "=" * 80,
+        f"推荐设计: {best_design['design_name']}",
+        f"综合评分: {best_design['comprehensive_score']:.3f}",
+        f"冷却功率: {best_design['performance']:.1f} W/m²",
+        f"成本效益: {best_design['cost_effectiveness']:.2f} W/$",
+        f"投资回收期: {best_design['payback_period']:.2f} 年",
+        "",
+        "💰 详细经济性分析:",
+        f"  总投资: ${economic_analysis['capital_investment']['total_investment']:,.0f}",
+        f"  年利润: ${economic_analysis['revenue_analysis']['annual_profit']:,.0f}",
+        f"  投资回收期: {economic_analysis['investment_metrics']['payback_period']:.2f} 年",
+        f"  第一年ROI: {economic_analysis['investment_metrics']['roi_first_year']:.1f}%",
+        f"  5年净现值: ${economic_analysis['investment_metrics']['npv_5years']:,.0f}",
+        "",
+        "🔧 技术可行性:",
+        f"  材料可获得性: {tech_feasibility['material_availability']}",
+        f"  工艺成熟度: {tech_feasibility['process_maturity']}",
+        f"  规模化能力: {tech_feasibility['scalability']}",
+        f"  预期寿命: {tech_feasibility['lifespan']}",
+    ]
 
-    print(f"\n🏭 制造可行性:")
-    manufacturing = best_evaluation['manufacturing_feasibility']
-    print(f"  预计良率: {manufacturing['yield_estimation']}")
-    print(f"  生产效率: {manufacturing['production_rate']}")
-    print("  工艺流程:")
-    for step in manufacturing['process_flow']:
-        print(f"    • {step}")
+    if tech_feasibility['technical_risks']:
+        lines.append(f"  技术风险: {', '.join(tech_feasibility['technical_risks'])}")
+
+    lines += [
+        "",
+        "🏭 制造可行性:",
+        f"  预计良率: {manufacturing['yield_estimation']}",
+        f"  生产效率: {manufacturing['production_rate']}",
+        "  工艺流程:",
+    ]
+    lines += [f"    • {step}" for step in manufacturing['process_flow']]
 
-    print(f"\n🌍 环境适应性:")
-    for env_perf in best_evaluation['environment_performances']:
-        print(f"  {env_perf['location']}: {env_perf['P_net']:.1f} W/m² (ΔT={env_perf['delta_T']:.1f}K)")
+    lines.append("")
+    lines.append("🌍 环境适应性:")
+    lines += [f"  {env_perf['location']}: {env_perf['P_net']:.1f} W/m² (ΔT={env_perf['delta_T']:.1f}K)"
+              for env_perf in best_evaluation['environment_performances']]
 
     # 应用场景建议
-    print(f"\n🎯 推荐应用场景:")
     applications = [
         "商业建筑屋顶冷却系统",
         "数据中心节能散热",
@@ -452,21 +506,22 @@ def run_problem4_comprehensive_solution():
         "工业设备被动冷却",
         "户外电子设备热管理"
     ]
-
-    for i, app in enumerate(applications, 1):
-        print(f"  {i}. {app}")
+    lines.append("")
+    lines.append("🎯 推荐应用场景:")
+    lines += [f"  {i}. {app}" for i, app in enumerate(applications, 1)]
 
     # 实施路线图
-    print(f"\n📅 产业化实施路线图:")
     roadmap = [
         "阶段1 (0-6个月): 原型开发与实验室验证",
         "阶段2 (6-12个月): 中试生产线建设",
         "阶段3 (12-18个月): 规模化生产与市场推广",
         "阶段4 (18-24个月): 技术优化与产品迭代"
     ]
+    lines.append("")
+    lines.append("📅 产业化实施路线图:")
+    lines += [f"  • {stage}" for stage in roadmap]
 
-    for stage in roadmap:
-        print(f"  • {stage}")
+    print("\n".join(lines))
 
     return optimizer, best_design, all_comparisons, design_evaluations
 
@@ -475,20 +530,26 @@ def plot_comprehensive_results(optimizer, best_design, comparisons, design_evalu
     """绘制综合结果图表"""
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(18, 14))
 
-    # 1. 设计方案综合对比雷达图
+    # 1. 设计方案综合对比雷达图：指标一趟压成(n,4)矩阵，归一化整体广播
     design_names = [comp['design_name'] for comp in comparisons]
-    performance_scores = [comp['performance'] / 150 for comp in comparisons]
-    cost_scores = [1 - (comp['cost_per_m2'] / 60) for comp in comparisons]
-    feasibility_scores = [0.9 if comp['technical_feasibility'] == '高' else 0.7 for comp in comparisons]
-    payback_scores = [1 - min(comp['payback_period'] / 5, 1) for comp in comparisons]
+    raw_metrics = np.array([[comp['performance'], comp['cost_per_m2'],
+                             1.0 if comp['technical_feasibility'] == '高' else 0.0,
+                             comp['payback_period']] for comp in comparisons])
+    radar_scores = np.stack([
+        raw_metrics[:, 0] / 150,
+        1 - raw_metrics[:, 1] / 60,
+        np.where(raw_metrics[:, 2] == 1.0, 0.9, 0.7),
+        1 - np.minimum(raw_metrics[:, 3] / 5, 1),
+    ], axis=1)
 
     categories = ['性能', '成本', '可行性', '投资回报']
 
+    # 角度只算一次，闭合点直接拼接
+    angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False)
+    angles = np.concatenate([angles, angles[:1]])
+
     for i, design_name in enumerate(design_names):
-        values = [performance_scores[i], cost_scores[i], feasibility_scores[i], payback_scores[i]]
-        values += values[:1]
-        angles = np.linspace(0, 2 * np.pi, len(categories), endpoint=False).tolist()
-        angles += angles[:1]
+        values = np.concatenate([radar_scores[i], radar_scores[i, :1]])
 
         ax1.plot(angles, values, 'o-', linewidth=2, label=design_name)
         ax1.fill(angles, values, alpha=0.1)
@@ -519,34 +580,15 @@ def plot_comprehensive_results(optimizer, best_design, comparisons, design_evalu
                  f'{value:.2f}', ha='center', va='bottom', fontweight='bold')
 
     # 3. 成本结构分析
-    best_design_key = None
-    for key, design in optimizer.optimal_designs.items():
-        if design['description'] == best_design['design_name']:
-            best_design_key = key
-            break
-
-    if best_design_key is None:
-        best_design_key = 'multilayer_optimal'
-
-    best_eval = design_evaluations[best_design_key]
+    best_eval = design_evaluations[best_design['design_key']]
     cost_data = best_eval['cost_data']
 
-    # 计算各材料实际成本
-    material_costs = {}
+    # 计算各材料实际成本（defaultdict单趟累加，免去成员测试分支）
+    material_costs = defaultdict(float)
     for layer_cost in cost_data['layer_costs']:
-        material = layer_cost['material']
-        cost = layer_cost['cost']
-        if material in material_costs:
-            material_costs[material] += cost
-        else:
-            material_costs[material] = cost
-
-    # 构建成本结构数据
-    cost_labels = []
-    cost_values = []
-    colors = []
+        material_costs[layer_cost.material] += layer_cost.cost
 
-    # 添加材料成本
+    # 构建成本结构数据：(标签, 数值, 颜色)三元组一趟收集，最后一次解包
     material_colors = {
         'Ag': '#FF6B6B',
         'SiO2': '#4ECDC4',
@@ -554,13 +596,6 @@ def plot_comprehensive_results(optimizer, best_design, comparisons, design_evalu
         'PDMS': '#96CEB4'
     }
 
-    for material, cost in material_costs.items():
-        if cost > 0:
-            cost_labels.append(f'{material}材料')
-            cost_values.append(cost)
-            colors.append(material_colors.get(material, '#F8E71C'))
-
-    # 添加其他成本项
     other_costs = {
         '制造工艺': cost_data['fabrication_cost'],
         '衬底': cost_data['substrate_cost'],
@@ -573,16 +608,16 @@ def plot_comprehensive_results(optimizer, best_design, comparisons, design_evalu
         '安装': '#F7DC6F'
     }
 
-    for label, cost in other_costs.items():
-        if cost > 0:
-            cost_labels.append(label)
-            cost_values.append(cost)
-            colors.append(other_colors.get(label, '#BB8FCE'))
+    cost_items = [(f'{material}材料', cost, material_colors.get(material, '#F8E71C'))
+                  for material, cost in material_costs.items() if cost > 0]
+    cost_items += [(label, cost, other_colors.get(label, '#BB8FCE'))
+                   for label, cost in other_costs.items() if cost > 0]
 
     # 绘制饼图
-    if cost_values:
-        wedges, texts, autotexts = ax3.pie(cost_values, labels=cost_labels, autopct='%1.1f%%',
-                                           startangle=90, colors=colors)
+    if cost_items:
+        cost_labels, cost_values, colors = zip(*cost_items)
+        wedges, texts, autotexts = ax3.pie(np.asarray(cost_values), labels=cost_labels,
+                                           autopct='%1.1f%%', startangle=90, colors=colors)
         for autotext in autotexts:
             autotext.set_color('white')
             autotext.set_fontweight('bold')
@@ -617,17 +652,8 @@ def plot_comprehensive_results(optimizer, best_design, comparisons, design_evalu
 def generate_final_report(optimizer, best_design, comparisons, design_evaluations):
     """修正的最终技术报告生成"""
 
-    # 修正：正确匹配设计评估
-    best_design_key = None
-    for key, design in optimizer.optimal_designs.items():
-        if design['description'] == best_design['design_name']:
-            best_design_key = key
-            break
-
-    if best_design_key is None:
-        best_design_key = 'multilayer_optimal'
-
-    best_eval = design_evaluations[best_design_key]
+    # 修正：对比结果自带design_key，直接匹配设计评估
+    best_eval = design_evaluations[best_design['design_key']]
 
     # 确保使用正确的结构描述
     actual_structure = best_eval['design_info']['structure']
@@ -640,8 +666,8 @@ def generate_final_report(optimizer, best_design, comparisons, design_evaluation
     # 经济分析
     economic_data = optimizer.economic_analysis(best_eval)
 
-    # 生成报告
-    report = f"""
+    # 生成报告：各段先收集到parts，最后一次join（避免+=逐段复制整串）
+    report_header = f"""
 ## 执行摘要
 
 基于系统性的建模、优化和评估，我们推荐采用 **{best_design['design_name']}** 作为最优辐射制冷解决方案。
@@ -696,10 +722,10 @@ def generate_final_report(optimizer, best_design, comparisons, design_evaluation
 """
 
     # 修正：正确显示制造流程
-    for step in best_eval['manufacturing_feasibility']['process_flow']:
-        report += f"- {step}\n"
+    parts = [report_header]
+    parts += [f"- {step}\n" for step in best_eval['manufacturing_feasibility']['process_flow']]
 
-    report += f"""
+    parts.append(f"""
 ## 环境与社会效益
 
 ### 节能效果
@@ -729,8 +755,9 @@ def generate_final_report(optimizer, best_design, comparisons, design_evaluation
 本综合优化设计方案在**技术性能、经济可行性和制造可实现性**三个方面均表现出色，具备产业化推广的充分条件。该技术不仅具有良好的经济效益，更在节能减排和可持续发展方面具有重要价值。
 
 **推荐立即启动产业化进程**，抢占辐射制冷技术市场先机。
-"""
+""")
 
+    report = "".join(parts)
     print(report)
 
     # 保存报告到文件
@@ -742,6 +769,9 @@ def generate_final_report(optimizer, best_design, comparisons, design_evaluation
 
 # 运行问题四完整解决方案
 if __name__ == "__main__":
+    # 默认WARNING：热路径的debug诊断零成本短路，需要时调到DEBUG
+    logging.basicConfig(level=logging.WARNING)
+
     # 执行综合优化分析
     optimizer, best_design, comparisons, design_evaluations = run_problem4_comprehensive_solution()
 